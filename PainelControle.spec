@@ -5,7 +5,7 @@ a = Analysis(
     ['main.py'],
     pathex=[],
     binaries=[],
-    datas=[('fotos', 'fotos'), ('presets', 'presets'), ('templates', 'templates'), ('vereadores.json', '.'), ('session_config.json', '.')],
+    datas=[('fotos', 'fotos'), ('presets', 'presets'), ('templates', 'templates'), ('static', 'static'), ('vereadores.json', '.'), ('session_config.json', '.')],
     hiddenimports=['engineio.async_drivers.threading', 'flask_socketio', 'engineio'],
     hookspath=[],
     hooksconfig={},
@@ -17,6 +17,8 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QPixmap, QIcon, QColor, QFont
 
+from photo_cache import get_photo_cache
+
 class VereadoresAdminDialog(QDialog):
     """Dialog para administração de vereadores"""
     
@@ -1119,14 +1121,10 @@ class VereadoresAdminDialog(QDialog):
             current_foto = self.current_vereador['foto']
             self.selected_foto_path = current_foto  
             
-            # Tentar primeiro em AppData, depois no Bundle
-            foto_path = self.session_config.get_data_path(current_foto)
-            if not os.path.exists(foto_path):
-                foto_path = self.session_config.get_bundle_path(current_foto)
-                
-            if os.path.exists(foto_path):
-                pixmap = QPixmap(foto_path)
-                self.foto_label.setPixmap(pixmap.scaled(150, 150, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+            # Miniatura do cache (AppData primeiro, depois Bundle)
+            pixmap = get_photo_cache(self.session_config).get_pixmap(current_foto, 'preview')
+            if pixmap is not None:
+                self.foto_label.setPixmap(pixmap)
             else:
                 self.set_placeholder_photo()
         else:
@@ -1251,8 +1249,9 @@ class VereadoresAdminDialog(QDialog):
             self.selected_foto_path = f"fotos/{filename}"
             
             # Exibir foto
-            pixmap = QPixmap(dest_path)
-            self.foto_label.setPixmap(pixmap.scaled(150, 150, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+            pixmap = get_photo_cache(self.session_config).get_pixmap(self.selected_foto_path, 'preview')
+            if pixmap is not None:
+                self.foto_label.setPixmap(pixmap)
     
     def remover_foto(self):
         """Remover foto do vereador"""
@@ -0,0 +1,66 @@
+"""
+Animação de Piscar
+Alterna a opacidade de um widget com QPropertyAnimation (sem trocar QSS,
+sem re-polir nem refazer layout a cada piscada)
+"""
+
+from PySide6.QtWidgets import QGraphicsOpacityEffect
+from PySide6.QtCore import QObject, QPropertyAnimation
+
+
+class BlinkAnimation(QObject):
+    """Piscar por opacidade animada
+
+    Widgets com propriedade Qt 'opacity' (ex: BigTimerDisplay) são animados
+    diretamente; nos demais é usado um QGraphicsOpacityEffect, ligado só
+    enquanto pisca.
+    """
+
+    def __init__(self, widget, low_opacity=0.1, parent=None):
+        super().__init__(parent or widget)
+        self.widget = widget
+        self.low_opacity = low_opacity
+        self.interval = 0
+
+        self.effect = None
+        target = widget
+        if widget.metaObject().indexOfProperty('opacity') < 0:
+            self.effect = QGraphicsOpacityEffect(widget)
+            self.effect.setEnabled(False)
+            widget.setGraphicsEffect(self.effect)
+            target = self.effect
+
+        # Aceso -> apagado -> aceso, com transições curtas (parece on/off)
+        self.animation = QPropertyAnimation(target, b"opacity", self)
+        self.animation.setLoopCount(-1)
+        self.animation.setKeyValueAt(0.0, 1.0)
+        self.animation.setKeyValueAt(0.4, 1.0)
+        self.animation.setKeyValueAt(0.5, low_opacity)
+        self.animation.setKeyValueAt(0.9, low_opacity)
+        self.animation.setKeyValueAt(1.0, 1.0)
+
+    def is_active(self):
+        return self.animation.state() == QPropertyAnimation.State.Running
+
+    def start(self, interval_ms):
+        """Piscar trocando de estado a cada interval_ms (ciclo = 2x intervalo)"""
+        if self.is_active() and interval_ms == self.interval:
+            return
+        self.interval = interval_ms
+        self.animation.stop()
+        self.animation.setDuration(2 * interval_ms)
+        if self.effect is not None:
+            self.effect.setEnabled(True)
+        self.animation.start()
+
+    def stop(self):
+        """Parar e deixar o widget totalmente visível"""
+        if not self.is_active() and self.interval == 0:
+            return
+        self.animation.stop()
+        self.interval = 0
+        if self.effect is not None:
+            self.effect.setOpacity(1.0)
+            self.effect.setEnabled(False)
+        else:
+            self.widget.setProperty('opacity', 1.0)
@@ -0,0 +1,73 @@
+"""
+Agrupamento de Emissões Socket.IO
+Eventos repetidos (ex: acréscimo/desconto de tempo em rajada) são agrupados
+por chave numa janela curta e só o valor mais recente é enviado; transições
+(start/pause/stop) saem na hora e na ordem em que aconteceram
+"""
+
+import threading
+
+
+class EmitCoalescer:
+    """Emissões agrupadas por chave
+
+    emit(event, *args) envia de fato; spawn(fn) roda fn em segundo plano e
+    sleep(s) espera (use socketio.start_background_task/socketio.sleep para
+    funcionar em threading, eventlet e gevent). window <= 0 desliga o
+    agrupamento. `lock` (RLock) pode ser compartilhado com outras emissões
+    para que todas saiam numa única ordem.
+    """
+
+    def __init__(self, emit, window, spawn, sleep, lock=None):
+        self.emit = emit
+        self.window = window
+        self.spawn = spawn
+        self.sleep = sleep
+        self.lock = lock if lock is not None else threading.RLock()  # Também ordena as emissões entre threads
+        self.pending = {}             # chave -> (evento, payload)
+        self.scheduled = False
+
+    def submit(self, key, event, payload):
+        """Agendar emissão; substitui a pendente da mesma chave
+
+        payload pode ser uma função sem argumentos, avaliada só no envio
+        (ex: tempo restante calculado no instante da emissão).
+        """
+        with self.lock:
+            if self.window <= 0:
+                self._emit(event, payload)
+                return
+            self.pending[key] = (event, payload)
+            if self.scheduled:
+                return
+            self.scheduled = True
+        self.spawn(self._flush_later)
+
+    def emit_now(self, key, event, payload):
+        """Transição: emite imediatamente, descartando a pendente da chave
+
+        A pendente é mais antiga que a transição, então enviá-la depois
+        entregaria um estado velho fora de ordem.
+        """
+        with self.lock:
+            self.pending.pop(key, None)
+            self._emit(event, payload)
+
+    def flush(self):
+        """Enviar todas as pendentes"""
+        with self.lock:
+            pending, self.pending = self.pending, {}
+            self.scheduled = False
+            for event, payload in pending.values():
+                self._emit(event, payload)
+
+    def _flush_later(self):
+        self.sleep(self.window)
+        self.flush()
+
+    def _emit(self, event, payload):
+        if callable(payload):
+            payload = payload()
+            if payload is None:
+                return  # Nada a enviar (ex: transição sem mudança)
+        self.emit(event, payload)
@@ -0,0 +1,162 @@
+"""
+Transmissão de Quadros da Tela do Plenário
+Captura a janela (QWidget.grab) só quando o conteúdo muda e há clientes,
+codifica em JPEG numa thread própria e descarta quadros repetidos; o servidor
+entrega os quadros como MJPEG (OBS, navegadores) ou PNG avulso
+"""
+
+import hashlib
+import threading
+import time
+
+from PySide6.QtCore import Qt, QBuffer, QByteArray, QEvent, QIODevice, QObject, QTimer, Signal, Slot
+from PySide6.QtGui import QImage
+
+STREAM_FPS = 15            # Taxa máxima de captura
+STREAM_JPEG_QUALITY = 80
+STREAM_MAX_WIDTH = 1920    # Telas 4K são reduzidas antes de codificar
+
+
+def encode_image(image, fmt, quality=-1):
+    """Codificar QImage em bytes (QImage é thread-safe para leitura)"""
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    image.save(buffer, fmt, quality)
+    buffer.close()
+    return bytes(data)
+
+
+class FrameStreamer(QObject):
+    """Fonte de quadros de um widget para o servidor
+
+    Thread da GUI: detecta repinturas (UpdateRequest na janela) e captura no
+    máximo `fps` vezes por segundo, apenas enquanto houver interessados.
+    Thread de codificação: reduz, compara com o último quadro (hash dos
+    pixels) e só então codifica. Threads do Flask: subscribe/wait_frame.
+    """
+
+    demand_changed = Signal()  # Emitido de qualquer thread; tratado na GUI
+
+    def __init__(self, widget, fps=STREAM_FPS, parent=None):
+        super().__init__(parent)
+        self.widget = widget
+        self.fps = fps
+        self.dirty = True
+
+        self.grab_timer = QTimer(self)
+        self.grab_timer.setInterval(max(1, round(1000 / fps)))
+        self.grab_timer.timeout.connect(self._grab)
+        self.demand_changed.connect(self._on_demand_changed, Qt.ConnectionType.QueuedConnection)
+        widget.installEventFilter(self)
+
+        self.lock = threading.Lock()
+        self.frame_ready = threading.Condition(self.lock)
+        self.subscribers = 0
+        self.snapshot_requests = 0
+        self.pending = None        # Último QImage capturado aguardando codificação
+        self.last_digest = None
+        self.image = None          # Último quadro distinto (QImage reduzido)
+        self.jpeg = None           # ... e seu JPEG
+        self.seq = 0               # Incrementa a cada quadro distinto
+
+        self.encoder = threading.Thread(target=self._encode_loop, daemon=True)
+        self.encoder.start()
+
+    # --- Thread da GUI ---
+
+    def eventFilter(self, obj, event):
+        if obj is self.widget and event.type() == QEvent.Type.UpdateRequest:
+            self.dirty = True  # Algo na janela foi repintado
+        return False
+
+    @Slot()
+    def _on_demand_changed(self):
+        with self.lock:
+            wanted = self.subscribers > 0 or self.snapshot_requests > 0
+        if wanted and not self.grab_timer.isActive():
+            self.dirty = True  # Novo cliente precisa de um quadro já
+            self.grab_timer.start()
+        elif not wanted:
+            self.grab_timer.stop()
+
+    def _grab(self):
+        if not self.dirty or not self.widget.isVisible():
+            return
+        self.dirty = False
+        image = self.widget.grab().toImage()
+        with self.lock:
+            self.pending = image  # Substitui quadro ainda não codificado
+            self.frame_ready.notify_all()
+
+    # --- Thread de codificação ---
+
+    def _encode_loop(self):
+        while True:
+            with self.lock:
+                while self.pending is None:
+                    self.frame_ready.wait()
+                image, self.pending = self.pending, None
+
+            if image.width() > STREAM_MAX_WIDTH:
+                image = image.scaledToWidth(STREAM_MAX_WIDTH, Qt.TransformationMode.SmoothTransformation)
+            image = image.convertToFormat(QImage.Format.Format_RGB32)
+
+            # Descartar quadro idêntico ao anterior (ex: repintura sem mudança visível)
+            digest = hashlib.blake2b(image.constBits(), digest_size=16).digest()
+            if digest == self.last_digest:
+                continue
+            self.last_digest = digest
+
+            jpeg = encode_image(image, 'JPEG', STREAM_JPEG_QUALITY)
+            with self.lock:
+                self.image = image
+                self.jpeg = jpeg
+                self.seq += 1
+                self.frame_ready.notify_all()
+
+    # --- Threads do servidor ---
+
+    def subscribe(self):
+        with self.lock:
+            self.subscribers += 1
+        self.demand_changed.emit()
+
+    def unsubscribe(self):
+        with self.lock:
+            self.subscribers = max(0, self.subscribers - 1)
+        self.demand_changed.emit()
+
+    def wait_frame(self, last_seq, timeout):
+        """Esperar quadro mais novo que last_seq; após timeout devolve o atual
+
+        Retorna (seq, jpeg); jpeg None se ainda não houve captura.
+        """
+        deadline = time.monotonic() + timeout
+        with self.lock:
+            while self.seq == last_seq:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self.frame_ready.wait(remaining)
+            return self.seq, self.jpeg
+
+    def snapshot_png(self, timeout=2.0):
+        """Quadro atual em PNG (captura sob demanda se ninguém estiver assistindo)"""
+        with self.lock:
+            self.snapshot_requests += 1
+            seq = self.seq
+            # Sem quadro ainda: esperar a primeira captura. Com quadro: dar
+            # alguns ciclos para uma captura nova (se a tela mudou desde então)
+            if self.image is not None:
+                timeout = min(timeout, 3.0 / self.fps)
+        self.demand_changed.emit()
+        try:
+            with self.lock:
+                self.frame_ready.wait_for(lambda: self.seq != seq and self.image is not None, timeout)
+                image = self.image
+        finally:
+            with self.lock:
+                self.snapshot_requests -= 1
+            self.demand_changed.emit()
+        return encode_image(image, 'PNG') if image is not None else None
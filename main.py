@@ -7,6 +7,7 @@ Desenvolvido com PyQt6
 import sys
 import json
 import os
+import copy
 from typing import Optional
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
@@ -21,35 +22,131 @@ import socket
 from arduino_controller import ArduinoController
 from admin_vereadores import VereadoresAdminDialog
 from tela_plenario import TelaPlenario
-import urllib.request
-import urllib.error
+import http.client
 import threading
+from collections import deque
 import server
 import multiprocessing
 import logger_setup
 from session_config import SessionConfig
+from timer_engine import CountdownTimer
+from photo_cache import get_photo_cache
+from vereadores_grid import VereadoresModel, VereadoresGridView
+from theme import panel_stylesheet, set_state
+from blink_animation import BlinkAnimation
+from frame_stream import FrameStreamer
 
 # Inicializar LOG
 # Deve ser chamado antes de qlqr outra coisa
 logger_setup.setup_logger("painel")
 
-def api_post(endpoint, data):
-    """Envia comando HTTP POST para o servidor Flask em background"""
-    def run():
+class ApiClient:
+    """Entrega os comandos do painel ao servidor em background
+
+    O painel sempre sobe o servidor no mesmo processo (main), então os
+    comandos vão direto para `dispatch`, sem JSON nem HTTP. Um único worker
+    consome a fila em ordem (FIFO) para a GUI nunca esperar pelas emissões.
+    A fila tem limite rígido: cheia, descarta primeiro comandos já
+    substituídos por um mais novo (orador, ajuste de tempo, áudio...) e, se
+    ainda faltar espaço, o mais antigo.
+
+    Sem `dispatch` (painel usado sem main) cai num POST HTTP simples para
+    o servidor local, sem nova tentativa.
+    """
+
+    def __init__(self, host='127.0.0.1', port=5000, maxsize=256, timeout=1.0):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.dispatch = None
+        self.maxsize = maxsize
+        self.pending = deque()  # (chave de substituição, endpoint, dados)
+        self.ready = threading.Condition()
+        self.worker = threading.Thread(target=self._run, daemon=True)
+        self.worker.start()
+
+    @staticmethod
+    def _supersede_key(endpoint, data):
+        """Comandos com a mesma chave só valem pelo mais recente (None = transição)"""
+        if endpoint == 'timer':
+            # Ajustes enviam o restante absoluto; start/pause/stop são transições
+            return 'timer' if data.get('action') in ('adjust', 'update') else None
+        return endpoint  # speaker, audio, arduino, config_update: estado/aviso
+
+    def post(self, endpoint, data):
+        """Enfileirar comando (não bloqueia a GUI)"""
+        key = self._supersede_key(endpoint, data or {})
+        with self.ready:
+            if len(self.pending) >= self.maxsize:
+                self._drop_superseded()
+            if len(self.pending) >= self.maxsize:
+                self.pending.popleft()
+                print("⚠️ Fila da API cheia: comando mais antigo descartado")
+            self.pending.append((key, endpoint, data))
+            self.ready.notify()
+
+    def _drop_superseded(self):
+        """Remover comandos que já têm versão mais nova na fila"""
+        seen = set()
+        kept = deque()
+        for item in reversed(self.pending):
+            key = item[0]
+            if key is not None:
+                if key in seen:
+                    continue  # Substituído por um comando posterior
+                seen.add(key)
+            kept.appendleft(item)
+        if len(kept) < len(self.pending):
+            print(f"⚠️ Fila da API cheia: {len(self.pending) - len(kept)} comando(s) substituído(s) descartado(s)")
+        self.pending = kept
+
+    def _run(self):
+        while True:
+            with self.ready:
+                while not self.pending:
+                    self.ready.wait()
+                _, endpoint, data = self.pending.popleft()
+            try:
+                if self.dispatch is not None:
+                    self.dispatch(endpoint, data)
+                else:
+                    self._post_http(endpoint, data)
+            except OSError:
+                pass  # Silencioso em caso de erro de conexão (server offline)
+            except Exception as e:
+                print(f"Erro ao enviar ação ({endpoint}): {e}")
+
+    def _post_http(self, endpoint, data):
+        # http.client direto para não passar pela detecção de proxy do Windows
+        conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
         try:
-            url = f"http://127.0.0.1:5000/api/action/{endpoint}"
-            req = urllib.request.Request(url)
-            req.add_header('Content-Type', 'application/json')
-            jsondata = json.dumps(data).encode('utf-8')
-            req.add_header('Content-Length', len(jsondata))
-            with urllib.request.urlopen(req, jsondata, timeout=1) as response:
-                pass # Sucesso
-        except Exception as e:
-            # Silencioso em caso de erro de conexão (server offline)
-            # print(f"Erro API ({endpoint}): {e}")
-            pass
-    
-    threading.Thread(target=run, daemon=True).start()
+            conn.request('POST', f"/api/action/{endpoint}", body=json.dumps(data).encode('utf-8'),
+                         headers={'Content-Type': 'application/json'})
+            conn.getresponse().read()
+        finally:
+            conn.close()
+
+
+_api_client = None
+_api_client_lock = threading.Lock()
+
+def get_api_client():
+    """Obter (criando se preciso) o cliente compartilhado da API"""
+    global _api_client
+    if _api_client is None:
+        with _api_client_lock:
+            if _api_client is None:
+                _api_client = ApiClient()
+    return _api_client
+
+def use_in_process_server(dispatch):
+    """Entregar os comandos direto ao servidor que roda neste processo"""
+    get_api_client().dispatch = dispatch
+
+def api_post(endpoint, data):
+    """Envia comando para o servidor Flask em background"""
+    # Cópia para que o worker não veja alterações posteriores feitas pela GUI
+    get_api_client().post(endpoint, copy.deepcopy(data))
 
 
 
@@ -79,6 +176,11 @@ class ArduinoConnectionThread(QThread):
 
 class PainelPresidente(QMainWindow):
     """Janela principal do Painel do Presidente"""
+
+    # Intervalo do tick de display (ms). O tempo em si vem do relógio monotônico,
+    # o tick só detecta a troca de segundo e atualiza a tela.
+    TIMER_TICK_MS = 200
+    AVISO_BLINK_MS = 400  # Piscar do aviso "TEMPO ESGOTADO"
     
     def __init__(self):
         super().__init__()
@@ -87,7 +189,8 @@ class PainelPresidente(QMainWindow):
         self.vereadores = []
         self.selected_vereador = None
         self.total_seconds = 0
-        self.remaining_seconds = 0
+        self.countdown = CountdownTimer()
+        self.last_tick_seconds = 0 # Último segundo exibido pelo tick
         self.staged_seconds = 0 # Tempo preparado para o próximo ato (aparte)
         self.saved_main_seconds = 0 # Tempo salvo de quem sofreu aparte
         self.aparte_initial_seconds = 0 # Tempo inicial do aparte (para calculo de uso)
@@ -123,6 +226,7 @@ class PainelPresidente(QMainWindow):
         
         # Configuração da Sessão
         self.session_config = SessionConfig()
+        self.photo_cache = get_photo_cache(self.session_config)
         
         # Configurar UI primeiro
         self.init_ui()
@@ -138,6 +242,15 @@ class PainelPresidente(QMainWindow):
         print("DEBUG: Agendando inicialização...")
         QTimer.singleShot(100, self.delayed_init)
     
+    @property
+    def remaining_seconds(self):
+        """Tempo restante (segundos inteiros) derivado do prazo monotônico"""
+        return self.countdown.remaining_seconds()
+
+    @remaining_seconds.setter
+    def remaining_seconds(self, value):
+        self.countdown.set_remaining(value)
+
     def delayed_init(self):
         """Inicialização atrasada para evitar travamento da UI"""
         print("DEBUG: Executando delayed_init...")
@@ -214,46 +327,6 @@ class PainelPresidente(QMainWindow):
         # Abrir em fullscreen
         self.showFullScreen()
 
-    def resizeEvent(self, event):
-        """Ajustar altura dos cards de vereadores no redimensionamento"""
-        super().resizeEvent(event)
-        # O QGridLayout de 5 colunas se ajusta automaticamente.
-        # Aqui apenas atualizamos a altura dos cards para preencher 3 linhas.
-        QTimer.singleShot(50, self._update_card_sizes)
-
-    def _update_card_sizes(self):
-        """Calcula e aplica altura = scroll_area_height / 3 em todos os cards"""
-        if not hasattr(self, 'vereadores_scroll_area') or not hasattr(self, 'vereador_card_widgets'):
-            return
-        spacing = self.vereadores_grid.spacing()
-        available_h = self.vereadores_scroll_area.viewport().height()
-        # 4 linhas e 3 espaçamentos internos entre elas
-        card_h = max(80, (available_h - spacing * 3) // 4)
-        for card, foto_label, pixmap_orig in self.vereador_card_widgets:
-            card.setFixedHeight(card_h)
-            # Recalcular largura real do card
-            available_w = self.vereadores_scroll_area.viewport().width()
-            spacing_h = self.vereadores_grid.spacing()
-            card_w = max(80, (available_w - spacing_h * 4) // 5)
-            # Foto com crop para preencher exatamente a área disponível
-            foto_h = max(60, card_h - 55)  # reservar 55px para nome/partido
-            foto_w = card_w - 16  # margens do card_layout
-            if pixmap_orig and not pixmap_orig.isNull():
-                # Expandir e recortar centralizado
-                scaled = pixmap_orig.scaled(
-                    foto_w, foto_h,
-                    Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                    Qt.TransformationMode.SmoothTransformation
-                )
-                x = (scaled.width() - foto_w) // 2
-                y = (scaled.height() - foto_h) // 2
-                cropped = scaled.copy(x, y, foto_w, foto_h)
-                foto_label.setPixmap(cropped)
-                foto_label.setFixedSize(foto_w, foto_h)
-            else:
-                foto_label.setFixedSize(foto_w, foto_h)
-
-    
     def create_timer_section(self):
         """Criar seção do cronômetro"""
         group = QGroupBox("Cronômetro")
@@ -264,33 +337,14 @@ class PainelPresidente(QMainWindow):
         # Display do timer
         self.timer_label = QLabel("00:00")
         self.timer_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.timer_label.setStyleSheet("""
-            QLabel {
-                font-size: 60px;
-                font-weight: bold;
-                color: #4facfe;
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 rgba(102, 126, 234, 0.1),
-                    stop:1 rgba(118, 75, 162, 0.1));
-                border-radius: 15px;
-                padding: 10px;
-            }
-        """)
+        self.timer_label.setObjectName("timerDisplay")  # Estilo e estados no tema (theme.py)
+        self.timer_blink = BlinkAnimation(self.timer_label, 0.25)  # Aviso de tempo esgotado
         layout.addWidget(self.timer_label, 2) # Peso 2 para crescer
         
         # Status
         self.status_label = QLabel("⏸️ Aguardando")
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.status_label.setStyleSheet("""
-            QLabel {
-                font-size: 24px;
-                font-weight: bold;
-                color: #ffffff;
-                background: rgba(255, 255, 255, 0.1);
-                border-radius: 10px;
-                padding: 10px;
-            }
-        """)
+        self.status_label.setObjectName("statusLabel")
         layout.addWidget(self.status_label)
         
         # Controles Principais
@@ -436,28 +490,7 @@ class PainelPresidente(QMainWindow):
         self.btn_aparte.clicked.connect(self.conceder_aparte)
         self.btn_aparte.setMinimumHeight(80) 
         self.btn_aparte.setSizePolicy(QSizePolicy.Minimum, QSizePolicy.Expanding)
-        self.btn_aparte.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #e67e22, stop:1 #f39c12);
-                color: white;
-                font-weight: bold;
-                font-size: 24px;
-                border-radius: 8px;
-                margin-top: 5px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #d35400, stop:1 #e67e22);
-            }
-            QPushButton:pressed {
-                 background: #c0392b;
-            }
-            QPushButton:disabled {
-                background: rgba(255, 255, 255, 0.05);
-                color: #666;
-            }
-        """)
+        self.btn_aparte.setObjectName("btnAparte")
         self.btn_aparte.setCheckable(False)
         self.btn_aparte.setEnabled(False)
         controls_layout.addWidget(self.btn_aparte)
@@ -518,33 +551,13 @@ class PainelPresidente(QMainWindow):
         # Arduino Status
         self.arduino_status_label = QLabel("❌ Arduino: Desconectado")
         self.arduino_status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.arduino_status_label.setStyleSheet("""
-            QLabel {
-                font-size: 14px;
-                font-weight: bold;
-                color: #ffffff;
-                background-color: rgba(250, 112, 154, 0.4);
-                border: 1px solid #fa709a;
-                border-radius: 8px;
-                padding: 8px;
-            }
-        """)
+        self.arduino_status_label.setProperty('connStatus', True)
         layout.addWidget(self.arduino_status_label)
         
         # Server Status
         self.server_status_label = QLabel("❌ Servidor: Desconectado")
         self.server_status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.server_status_label.setStyleSheet("""
-            QLabel {
-                font-size: 14px;
-                font-weight: bold;
-                color: #ffffff;
-                background-color: rgba(250, 112, 154, 0.4);
-                border: 1px solid #fa709a;
-                border-radius: 8px;
-                padding: 8px;
-            }
-        """)
+        self.server_status_label.setProperty('connStatus', True)
         layout.addWidget(self.server_status_label)
         
         container.setLayout(layout)
@@ -715,13 +728,13 @@ class PainelPresidente(QMainWindow):
         layout.setContentsMargins(10, 15, 10, 10)
         layout.setSpacing(8)
 
-        # --- Área de scroll que contém o grid ---
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setFrameShape(QFrame.Shape.NoFrame)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll_area.setStyleSheet("""
-            QScrollArea { background: transparent; border: none; }
+        # --- Grid de cards (model/view: widgets constantes, cards pintados pelo delegate) ---
+        self.vereadores_model = VereadoresModel(self.photo_cache, self)
+        self.vereadores_view = VereadoresGridView()
+        self.vereadores_view.setModel(self.vereadores_model)
+        self.vereadores_view.vereador_clicked.connect(self._on_card_click)
+        self.vereadores_view.setStyleSheet("""
+            QListView { background: transparent; border: none; }
             QScrollBar:vertical {
                 background: rgba(255,255,255,0.05);
                 width: 8px;
@@ -732,20 +745,7 @@ class PainelPresidente(QMainWindow):
                 border-radius: 4px;
             }
         """)
-
-        # Widget interno que recebe o grid
-        self.grid_container = QWidget()
-        self.grid_container.setStyleSheet("background: transparent;")
-        self.vereadores_grid = QGridLayout(self.grid_container)
-        self.vereadores_grid.setContentsMargins(0, 0, 0, 0)
-        self.vereadores_grid.setSpacing(12)
-        # Tornar as 5 colunas igualmente esticadas
-        for col in range(5):
-            self.vereadores_grid.setColumnStretch(col, 1)
-
-        self.vereadores_scroll_area = scroll_area
-        scroll_area.setWidget(self.grid_container)
-        layout.addWidget(scroll_area, 3)  # stretch=3 → grid ocupa 75%, speaker 25%
+        layout.addWidget(self.vereadores_view, 3)  # stretch=3 → grid ocupa 75%, speaker 25%
 
         # Seção do orador
         self.create_speaker_section_content(layout)
@@ -755,79 +755,8 @@ class PainelPresidente(QMainWindow):
 
     
     def apply_styles(self):
-        """Aplicar estilos globais"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #0f0f23, stop:1 #1a1a2e);
-            }
-            QGroupBox {
-                font-size: 16px;
-                font-weight: bold;
-                color: #ffffff;
-                border: 2px solid rgba(102, 126, 234, 0.3);
-                border-radius: 10px;
-                margin-top: 10px;
-                padding-top: 10px;
-                background: rgba(255, 255, 255, 0.05);
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-            QPushButton {
-                background: rgba(255, 255, 255, 0.1);
-                color: white;
-                border: 1px solid rgba(255, 255, 255, 0.2);
-                border-radius: 8px;
-                padding: 8px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: rgba(102, 126, 234, 0.3);
-                border-color: #667eea;
-            }
-            QPushButton:pressed {
-                background: rgba(102, 126, 234, 0.5);
-            }
-            QPushButton:disabled {
-                background: rgba(255, 255, 255, 0.05);
-                color: #666;
-            }
-            QLineEdit, QSpinBox {
-                background: rgba(255, 255, 255, 0.1);
-                color: white;
-                border: 1px solid rgba(255, 255, 255, 0.2);
-                border-radius: 6px;
-                padding: 8px;
-                font-size: 14px;
-            }
-            QLineEdit:focus, QSpinBox:focus {
-                border-color: #667eea;
-            }
-            QListWidget {
-                background: rgba(255, 255, 255, 0.05);
-                color: white;
-                border: 1px solid rgba(255, 255, 255, 0.2);
-                border-radius: 8px;
-                padding: 0px;
-            }
-            QListWidget::item {
-                padding: 10px;
-                border-radius: 6px;
-                margin: 2px;
-            }
-            QListWidget::item:hover {
-                background: rgba(102, 126, 234, 0.2);
-            }
-            QListWidget::item:selected {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #667eea, stop:1 #764ba2);
-                color: white;
-            }
-        """)
+        """Aplicar estilos globais (QSS do tema, compilado uma vez pelas cores da sessão)"""
+        self.setStyleSheet(panel_stylesheet(self.session_config.get_colors()))
     
     def load_vereadores(self):
         """Carregar vereadores do JSON"""
@@ -852,146 +781,23 @@ class PainelPresidente(QMainWindow):
             self.populate_vereadores_list()
     
     def populate_vereadores_list(self, filter_text=''):
-        """Preencher grid de vereadores (5 colunas fixas)"""
-        # Limpar grid anterior
-        while self.vereadores_grid.count():
-            item = self.vereadores_grid.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        self.vereador_cards = {}  # mapa nome -> card para highlight de seleção
-        self.vereador_card_widgets = []  # lista (card, foto_label, pixmap_orig) para resize
-        row, col = 0, 0
-        COLS = 5
-
-        for vereador in self.vereadores:
-            nome = vereador['nome']
-            partido = vereador['partido']
-
-            if filter_text.lower() not in nome.lower() and filter_text.lower() not in partido.lower():
-                continue
-
-            # --- Card ---
-            card = QFrame()
-            card.setObjectName("vereador_card")
-            card.setCursor(Qt.CursorShape.PointingHandCursor)
-            card.setStyleSheet("""
-                QFrame#vereador_card {
-                    background: rgba(255,255,255,0.08);
-                    border: 1px solid rgba(255,255,255,0.12);
-                    border-radius: 12px;
-                }
-                QFrame#vereador_card:hover {
-                    background: rgba(102,126,234,0.25);
-                    border: 1px solid #667eea;
-                }
-            """)
-
-            card_layout = QVBoxLayout(card)
-            card_layout.setContentsMargins(8, 8, 8, 8)
-            card_layout.setSpacing(6)
-            card_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-
-            # Foto — o recorte dinâmico será feito em _update_card_sizes
-            foto_label = QLabel()
-            foto_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            foto_label.setStyleSheet("border: none; background: transparent;")
-            foto_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-
-            pixmap_orig = None  # Guardar original para recorte dinâmico
-            if vereador.get('foto'):
-                foto_path_data   = self.session_config.get_data_path(vereador['foto'])
-                foto_path_bundle = self.session_config.get_bundle_path(vereador['foto'])
-                foto_path = foto_path_data if os.path.exists(foto_path_data) else foto_path_bundle
-                if os.path.exists(foto_path):
-                    pixmap_orig = QPixmap(foto_path)
-                    if pixmap_orig.isNull():
-                        print(f'[AVISO] Foto inacessível: {foto_path}')
-                        pixmap_orig = None
-                        foto_label.setText('👤')
-                        foto_label.setStyleSheet('font-size: 60px; border: none; background: transparent;')
-                    else:
-                        foto_label.setPixmap(pixmap_orig.scaled(200, 200,
-                            Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                            Qt.TransformationMode.SmoothTransformation))
-                else:
-                    print(f'[AVISO] Foto nao encontrada: {vereador["foto"]}')
-                    print(f'  data  : {foto_path_data}')
-                    print(f'  bundle: {foto_path_bundle}')
-                    foto_label.setText('👤')
-                    foto_label.setStyleSheet('font-size: 60px; border: none; background: transparent;')
-            else:
-                foto_label.setText('👤')
-                foto_label.setStyleSheet('font-size: 60px; border: none; background: transparent;')
-
-            card_layout.addWidget(foto_label, 1)  # stretch=1 para crescer
-
-            # Nome
-            nome_label = QLabel(nome)
-            nome_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            nome_label.setWordWrap(True)
-            nome_label.setStyleSheet("color: white; font-size: 13px; font-weight: bold; border: none; background: transparent;")
-            card_layout.addWidget(nome_label)
-
-            # Partido
-            partido_label = QLabel(partido)
-            partido_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            partido_label.setStyleSheet("color: rgba(200,200,255,0.7); font-size: 12px; border: none; background: transparent;")
-            card_layout.addWidget(partido_label)
-
-            # Guardar dados no frame para recuperar no clique
-            card.setProperty('vereador_data', vereador)
-
-            # Conectar clique no card
-            card.mousePressEvent = lambda e, v=vereador: self._on_card_click(v)
-
-            self.vereadores_grid.addWidget(card, row, col)
-            self.vereador_cards[nome] = card
-            self.vereador_card_widgets.append((card, foto_label, pixmap_orig))
-
-            col += 1
-            if col >= COLS:
-                col = 0
-                row += 1
-
-        # Preencher espaços vazios na última linha com widgets transparentes
-        if col > 0:
-            for c in range(col, COLS):
-                spacer = QWidget()
-                spacer.setStyleSheet("background: transparent;")
-                self.vereadores_grid.addWidget(spacer, row, c)
-
-        # Iniciar redimensionamento dinâmico após a construção
-        QTimer.singleShot(100, self._update_card_sizes)
+        """Preencher grid de vereadores (5 colunas fixas)
+
+        O model aplica só a diferença em relação à lista atual (por id),
+        reaproveitando as linhas e fotos já carregadas.
+        """
+        filtro = filter_text.lower()
+        visiveis = [
+            v for v in self.vereadores
+            if filtro in v['nome'].lower() or filtro in v['partido'].lower()
+        ]
+        self.vereadores_model.set_vereadores(visiveis)
 
     def sync_list_selection(self):
         """Sincronizar seleção visual dos cards com o vereador atual"""
         if not self.selected_vereador:
             return
-        nome_alvo = self.selected_vereador.get('nome')
-        cards = getattr(self, 'vereador_cards', {})
-        for nome, card in cards.items():
-            if nome == nome_alvo:
-                card.setStyleSheet("""
-                    QFrame#vereador_card {
-                        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                            stop:0 #667eea, stop:1 #764ba2);
-                        border: 2px solid #00f2fe;
-                        border-radius: 12px;
-                    }
-                """)
-            else:
-                card.setStyleSheet("""
-                    QFrame#vereador_card {
-                        background: rgba(255,255,255,0.08);
-                        border: 1px solid rgba(255,255,255,0.12);
-                        border-radius: 12px;
-                    }
-                    QFrame#vereador_card:hover {
-                        background: rgba(102,126,234,0.25);
-                        border: 1px solid #667eea;
-                    }
-                """)
+        self.vereadores_model.set_selected(self.selected_vereador)
 
     def filter_vereadores(self):
         """Filtrar vereadores (barra de busca removida, mantido por compatibilidade)"""
@@ -1009,7 +815,7 @@ class PainelPresidente(QMainWindow):
         self.update_aparte_button_state()
         self.update_presets_state()
 
-        api_post('speaker', {'speaker': self.selected_vereador})
+        api_post('speaker', {'speaker': self.selected_vereador, 'aparte': self.is_parte_mode})
 
         if not self.is_running:
             self.live_vereador = self.selected_vereador
@@ -1054,22 +860,24 @@ class PainelPresidente(QMainWindow):
 
     def _load_photo_into(self, foto_filename, label_widget):
         """Carrega foto no label como circulo recortado via QPainter"""
-        if foto_filename:
-            foto_path_data   = self.session_config.get_data_path(foto_filename)
-            foto_path_bundle = self.session_config.get_bundle_path(foto_filename)
-            foto_path = foto_path_data if os.path.exists(foto_path_data) else foto_path_bundle
-            if os.path.exists(foto_path):
-                pixmap = QPixmap(foto_path)
-                if not pixmap.isNull():
-                    size = label_widget.width() or label_widget.minimumWidth() or 80
-                    circular = self._make_circular_pixmap(pixmap, size)
-                    label_widget.setPixmap(circular)
-                    return
-                else:
-                    print(f'[AVISO] Speaker foto invalida: {foto_path}')
-            else:
-                print(f'[AVISO] Speaker foto nao encontrada: {foto_filename}')
-        label_widget.setText('👤')
+        # Foto esperada neste label (descarta resultados de pedidos anteriores)
+        label_widget.setProperty('foto_pedida', foto_filename or '')
+        if not foto_filename:
+            label_widget.setText('👤')
+            return
+
+        def on_photo(pixmap):
+            if label_widget.property('foto_pedida') != foto_filename:
+                return
+            if pixmap is None:
+                print(f'[AVISO] Speaker foto nao encontrada ou inválida: {foto_filename}')
+                label_widget.setText('👤')
+                return
+            size = label_widget.width() or label_widget.minimumWidth() or 80
+            label_widget.setPixmap(self._make_circular_pixmap(pixmap, size))
+
+        if not self.photo_cache.request_pixmap(foto_filename, 'circle', on_photo):
+            label_widget.setText('👤')  # Placeholder até decodificar
 
     def update_aparte_button_state(self):
         """Atualizar estado do botão de aparte com base na lógica de orador"""
@@ -1077,7 +885,7 @@ class PainelPresidente(QMainWindow):
             # MODO ENCERRAR
             self.btn_aparte.setText("🛑 ENCERRAR APARTE")
             self.btn_aparte.setEnabled(True)
-            self.btn_aparte.setStyleSheet("background-color: #c0392b; color: white; font-weight: bold; font-size: 24px; min-height: 80px;")
+            set_state(self.btn_aparte, 'state', 'encerrar')
             
             # Bloquear botão PARAR geral durante o aparte
             self.stop_btn.setEnabled(False)
@@ -1085,21 +893,21 @@ class PainelPresidente(QMainWindow):
             # MODO CANCELAR SELEÇÃO
             self.btn_aparte.setText("❌ CANCELAR APARTE")
             self.btn_aparte.setEnabled(True)
-            self.btn_aparte.setStyleSheet("background-color: #34495e; color: white; font-weight: bold; font-size: 24px; min-height: 80px;")
+            set_state(self.btn_aparte, 'state', 'cancelar')
         elif self.is_running and self.selected_vereador and self.live_vereador:
             # Só permite aparte se o selecionado for diferente do que está falando ao vivo
             if self.selected_vereador['nome'] != self.live_vereador['nome']:
                 self.btn_aparte.setText("🗣️ CONCEDER APARTE")
                 self.btn_aparte.setEnabled(True)
-                self.btn_aparte.setStyleSheet("background-color: #f39c12; color: white; font-weight: bold; font-size: 24px; min-height: 80px;")
+                set_state(self.btn_aparte, 'state', 'conceder')
             else:
                 self.btn_aparte.setText("🗣️ CONCEDER APARTE")
                 self.btn_aparte.setEnabled(False)
-                self.btn_aparte.setStyleSheet("background-color: #3e3e3e; color: #888; font-weight: bold; font-size: 24px; min-height: 80px;")
+                set_state(self.btn_aparte, 'state', 'bloqueado')
         else:
             self.btn_aparte.setText("🗣️ CONCEDER APARTE")
             self.btn_aparte.setEnabled(False)
-            self.btn_aparte.setStyleSheet("background-color: #3e3e3e; color: #888; font-weight: bold; font-size: 24px; min-height: 80px;")
+            set_state(self.btn_aparte, 'state', 'bloqueado')
     
     def set_time(self, seconds):
         """Definir tempo (Normal ou Aparte)"""
@@ -1153,7 +961,7 @@ class PainelPresidente(QMainWindow):
         seconds_to_use = self.staged_seconds if self.staged_seconds > 0 else 60
         minutes = seconds_to_use // 60
         
-        self.remaining_seconds += seconds_to_use
+        self.countdown.add(seconds_to_use)  # Exato: não arredonda o restante
         self.update_display()
         
         # Se não estiver rodando, também atualiza o total para consistência visual
@@ -1164,6 +972,7 @@ class PainelPresidente(QMainWindow):
              # Normalmente adiciona-se ao tempo extra.
              self.total_seconds += seconds_to_use
             
+        api_post('timer', {'action': 'adjust', 'remaining': round(self.countdown.remaining(), 3), 'total': self.total_seconds})
         self.sync_tela_plenario()
         
         # Feedback visual rápido
@@ -1176,16 +985,14 @@ class PainelPresidente(QMainWindow):
         seconds_to_use = self.staged_seconds if self.staged_seconds > 0 else 60
         minutes = seconds_to_use // 60
         
-        self.remaining_seconds -= seconds_to_use
-        if self.remaining_seconds < 0:
-            self.remaining_seconds = 0
-            
+        self.countdown.add(-seconds_to_use)  # Exato; nunca fica negativo
         self.update_display()
         
         # Se não estiver rodando, também atualiza o total
         if not self.is_running:
              self.total_seconds = self.remaining_seconds
         
+        api_post('timer', {'action': 'adjust', 'remaining': round(self.countdown.remaining(), 3), 'total': self.total_seconds})
         self.sync_tela_plenario()
         
         # Feedback visual rápido
@@ -1217,7 +1024,9 @@ class PainelPresidente(QMainWindow):
         
         self.is_running = True
         self.is_paused = False
-        self.timer.start(1000)
+        self.countdown.start()
+        self.last_tick_seconds = self.remaining_seconds
+        self.timer.start(self.TIMER_TICK_MS)
         
         # Abrir áudio (Async)
         print("DEBUG: Abrindo áudio...")
@@ -1225,17 +1034,7 @@ class PainelPresidente(QMainWindow):
         
         # Atualizar UI
         self.status_label.setText("▶️ Em Execução")
-        self.status_label.setStyleSheet("""
-            QLabel {
-                font-size: 16px;
-                font-weight: bold;
-                color: #00f2fe;
-                background: rgba(0, 242, 254, 0.2);
-                border-radius: 20px;
-                padding: 10px 20px;
-                margin: 5px;
-            }
-        """)
+        set_state(self.status_label, 'state', 'executando')
         self.play_btn.setEnabled(False)
         self.pause_btn.setEnabled(True)
         # Botão Parar só é habilitado se NÃO estiver em modo aparte
@@ -1246,7 +1045,7 @@ class PainelPresidente(QMainWindow):
         self.update_presets_state()
         
         # Enviar para Servidor (API)
-        api_post('timer', {'action': 'start', 'remaining': self.remaining_seconds, 'total': self.total_seconds})
+        api_post('timer', {'action': 'start', 'remaining': round(self.countdown.remaining(), 3), 'total': self.total_seconds})
         
         # Sincronizar com tela do plenário
         # FORÇAR VISUAL DE ORADOR AGORA (Garante transição imediata)
@@ -1314,11 +1113,11 @@ class PainelPresidente(QMainWindow):
         if self.is_preparing_aparte:
              # Pequeno aviso sonoro ou visual de instrução poderia ir aqui
              self.status_label.setText("🗣️ SELECIONE O TEMPO DO APARTE")
-             self.status_label.setStyleSheet("background-color: #f39c12; color: white; font-weight: bold; border-radius: 20px; padding: 10px;")
+             set_state(self.status_label, 'state', 'aparte')
         else:
              # Cancelou
              self.status_label.setText("▶️ Em Execução")
-             self.status_label.setStyleSheet("background-color: rgba(0, 242, 254, 0.2); color: #00f2fe; border-radius: 20px; padding: 10px;")
+             set_state(self.status_label, 'state', 'executando')
 
     def executar_conceder_aparte(self, tempo_segundos):
         """Lógica interna de ativação do modo aparte"""
@@ -1333,8 +1132,8 @@ class PainelPresidente(QMainWindow):
         self.concedente = self.live_vereador
         self.receptor = self.selected_vereador
         
-        # Salvar tempo do orador principal para restaurar depois
-        self.saved_main_seconds = self.remaining_seconds
+        # Salvar tempo do orador principal para restaurar depois (valor exato, não arredondado)
+        self.saved_main_seconds = self.countdown.remaining()
         self.saved_main_total = self.total_seconds
         
         # Aparte visual
@@ -1348,7 +1147,7 @@ class PainelPresidente(QMainWindow):
         self.update_speaker_panel()
 
         # Configurar tempo de aparte (Já validado pelo menu, mas capar por segurança)
-        tempo_aparte = min(tempo_segundos, self.saved_main_seconds)
+        tempo_aparte = min(tempo_segundos, self.remaining_seconds)
             
         self.aparte_total_seconds = tempo_aparte # Salvar para cálculo de desconto
         self.set_time(tempo_aparte)
@@ -1359,7 +1158,8 @@ class PainelPresidente(QMainWindow):
         
         # Sincronizar com tela do plenário e API
         self.sync_tela_plenario()
-        api_post('speaker', {'speaker': self.live_vereador})
+        # live: o orador na tribuna muda mesmo com o cronômetro rodando
+        api_post('speaker', {'speaker': self.live_vereador, 'aparte': self.is_parte_mode, 'live': True})
         
         # Iniciar cronômetro automaticamente para o aparte
         self.start_timer()
@@ -1380,7 +1180,7 @@ class PainelPresidente(QMainWindow):
         # Calcular tempo gasto no aparte
         tempo_gasto = 0
         if hasattr(self, 'aparte_total_seconds'):
-            tempo_gasto = self.aparte_total_seconds - self.remaining_seconds
+            tempo_gasto = self.aparte_total_seconds - self.countdown.remaining()
             if tempo_gasto < 0: tempo_gasto = 0
             
         print(f"DEBUG: Tempo gasto no aparte: {tempo_gasto}s")
@@ -1417,7 +1217,8 @@ class PainelPresidente(QMainWindow):
         
         # Sincronizar (volta ao normal)
         self.sync_tela_plenario()
-        api_post('speaker', {'speaker': self.live_vereador})
+        # live: o orador na tribuna muda mesmo com o cronômetro rodando
+        api_post('speaker', {'speaker': self.live_vereador, 'aparte': self.is_parte_mode, 'live': True})
 
         # Retomar contagem automaticamente (devolver a palavra)
         if self.remaining_seconds > 0:
@@ -1430,29 +1231,20 @@ class PainelPresidente(QMainWindow):
         self.is_running = False
         self.is_paused = True
         self.timer.stop()
+        self.countdown.pause()
         
         # Cortar áudio (Async)
         self._run_arduino_async(self.arduino.cut_audio)
         
         # Atualizar UI
         self.status_label.setText("⏸️ Pausado")
-        self.status_label.setStyleSheet("""
-            QLabel {
-                font-size: 16px;
-                font-weight: bold;
-                color: #fee140;
-                background: rgba(254, 225, 64, 0.2);
-                border-radius: 20px;
-                padding: 10px 20px;
-                margin: 5px;
-            }
-        """)
+        set_state(self.status_label, 'state', 'pausado')
         self.play_btn.setEnabled(True)
         self.pause_btn.setEnabled(False)
         self.update_presets_state()
         
         # Enviar para Servidor (API)
-        api_post('timer', {'action': 'pause', 'remaining': self.remaining_seconds})
+        api_post('timer', {'action': 'pause', 'remaining': round(self.countdown.remaining(), 3)})
         
         # Sincronizar com tela do plenário
         self.sync_tela_plenario()
@@ -1466,6 +1258,7 @@ class PainelPresidente(QMainWindow):
         self.is_running = False
         self.is_paused = False
         self.timer.stop()
+        self.countdown.pause() # Congela o restante (aparte retoma daqui)
         
         # Cortar áudio (Async)
         self._run_arduino_async(self.arduino.cut_audio)
@@ -1484,17 +1277,7 @@ class PainelPresidente(QMainWindow):
         
         # Atualizar UI
         self.status_label.setText("⏸️ Aguardando")
-        self.status_label.setStyleSheet("""
-            QLabel {
-                font-size: 16px;
-                font-weight: bold;
-                color: #ffffff;
-                background: rgba(255, 255, 255, 0.1);
-                border-radius: 20px;
-                padding: 10px 20px;
-                margin: 5px;
-            }
-        """)
+        set_state(self.status_label, 'state', 'aguardando')
         self.play_btn.setEnabled(True)
         self.pause_btn.setEnabled(False)
         self.stop_btn.setEnabled(False)
@@ -1511,24 +1294,26 @@ class PainelPresidente(QMainWindow):
             self.tela_plenario.reset_timer_state()
     
     def update_timer(self):
-        """Atualizar cronômetro"""
-        if self.remaining_seconds > 0:
-            self.remaining_seconds -= 1
-            self.update_display()
-            
-            # Enviar para Servidor (API)
-            api_post('timer', {'action': 'update', 'remaining': self.remaining_seconds})
-            
-            # Sincronizar com tela do plenário
-            self.sync_tela_plenario()
-            
-            # Se estiver preparando aparte, atualizar botões (devido ao decréscimo de tempo)
-            if self.is_preparing_aparte:
-                self.update_presets_state()
-            
-            # Verificar se chegou a zero
-            if self.remaining_seconds == 0:
-                self.on_time_up()
+        """Atualizar cronômetro (tick de display; o tempo vem do prazo monotônico)"""
+        remaining = self.remaining_seconds
+        if remaining == self.last_tick_seconds:
+            return
+        self.last_tick_seconds = remaining
+
+        self.update_display()
+        
+        # Servidor calcula o restante sozinho (relógio monotônico): sem envio por tick
+        
+        # Sincronizar com tela do plenário
+        self.sync_tela_plenario()
+        
+        # Se estiver preparando aparte, atualizar botões (devido ao decréscimo de tempo)
+        if self.is_preparing_aparte:
+            self.update_presets_state()
+        
+        # Verificar se chegou a zero
+        if remaining == 0:
+            self.on_time_up()
     
     def on_time_up(self):
         """Tempo esgotado"""
@@ -1546,24 +1331,15 @@ class PainelPresidente(QMainWindow):
     def mostrar_aviso_tempo_esgotado(self):
         """Mostrar Aviso 'TEMPO ESGOTADO' no lugar do timer"""
         self.timer_label.setText("TEMPO\nESGOTADO")
-        self.timer_label.setStyleSheet("""
-            QLabel {
-                font-size: 60px;
-                font-weight: bold;
-                color: #ff4d4d;
-                background: rgba(255, 0, 0, 0.15);
-                border-radius: 15px;
-                padding: 10px;
-                border: 2px solid #ff4d4d;
-                margin: 10px;
-            }
-        """)
+        set_state(self.timer_label, 'state', 'esgotado')
+        self.timer_blink.start(self.AVISO_BLINK_MS)
         
         # Restaurar display normal após 3 segundos
         QTimer.singleShot(3000, self.restore_display_style)
         
     def restore_display_style(self):
         """Restaurar display para mostrar o tempo total selecionado"""
+        self.timer_blink.stop()
         # Apenas se não estiver rodando (usuário não iniciou outro timer)
         if not self.is_running:
             self.update_display()
@@ -1574,98 +1350,28 @@ class PainelPresidente(QMainWindow):
         seconds = self.remaining_seconds % 60
         self.timer_label.setText(f"{minutes:02d}:{seconds:02d}")
         
-        # Estilização do Timer
+        # Estilização do Timer (só troca a propriedade; QSS já compilado no tema)
         if self.is_parte_mode:
-             # Modo Aparte: Amarelo
-             self.timer_label.setStyleSheet("""
-                QLabel {
-                    font-size: 60px;
-                    font-weight: bold;
-                    color: #fceabb;
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                        stop:0 rgba(248, 181, 0, 0.2),
-                        stop:1 rgba(252, 234, 187, 0.2));
-                    border-radius: 15px;
-                    padding: 10px;
-                    border: 2px solid #f8b500;
-                    margin: 10px;
-                }
-            """)
-        elif self.remaining_seconds <= 10 and self.remaining_seconds > 0 and self.is_running:
-             # Danger Zone: Vermelho
-             self.timer_label.setStyleSheet("""
-                QLabel {
-                    font-size: 60px;
-                    font-weight: bold;
-                    color: #e74c3c;
-                    background: rgba(231, 76, 60, 0.1);
-                    border-radius: 15px;
-                    padding: 10px;
-                    border: 2px solid #e74c3c;
-                    margin: 10px;
-                }
-            """)
-        elif self.remaining_seconds <= 30 and self.remaining_seconds > 0 and self.is_running:
-             # Warning Zone: Amarelo/Laranja
-             self.timer_label.setStyleSheet("""
-                QLabel {
-                    font-size: 60px;
-                    font-weight: bold;
-                    color: #f39c12;
-                    background: rgba(243, 156, 18, 0.1);
-                    border-radius: 15px;
-                    padding: 10px;
-                    border: 2px solid #f39c12;
-                    margin: 10px;
-                }
-            """)
+            state = 'aparte'  # Amarelo
+        elif 0 < self.remaining_seconds <= 10 and self.is_running:
+            state = 'perigo'  # Vermelho
+        elif 0 < self.remaining_seconds <= 30 and self.is_running:
+            state = 'alerta'  # Amarelo/Laranja
         else:
-             # Normal: Azul
-             self.timer_label.setStyleSheet("""
-                QLabel {
-                    font-size: 60px;
-                    font-weight: bold;
-                    color: #4facfe;
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                        stop:0 rgba(102, 126, 234, 0.1),
-                        stop:1 rgba(118, 75, 162, 0.1));
-                    border-radius: 15px;
-                    padding: 10px;
-                    margin: 10px;
-                }
-            """)
+            state = 'normal'  # Azul
+        set_state(self.timer_label, 'state', state)
     
     def connect_arduino(self):
         """Conectar ao Arduino"""
         if self.arduino.connect():
-            self.arduino_status.setText("✅ Arduino: Conectado")
-            self.arduino_status.setStyleSheet("""
-                QLabel {
-                    font-size: 18px;
-                    font-weight: bold;
-                    color: #ffffff;
-                    background-color: rgba(0, 242, 254, 0.4);
-                    border: 1px solid #00f2fe;
-                    border-radius: 8px;
-                    padding: 10px;
-                }
-            """)
+            self.arduino_status_label.setText("✅ Arduino: Conectado")
+            set_state(self.arduino_status_label, 'connected', True)
             
             # Enviar status para Servidor (API)
             api_post('arduino', {'connected': True})
         else:
-            self.arduino_status.setText("❌ Arduino: Desconectado")
-            self.arduino_status.setStyleSheet("""
-                QLabel {
-                    font-size: 18px;
-                    font-weight: bold;
-                    color: #ffffff;
-                    background-color: rgba(250, 112, 154, 0.4);
-                    border: 1px solid #fa709a;
-                    border-radius: 8px;
-                    padding: 10px;
-                }
-            """)
+            self.arduino_status_label.setText("❌ Arduino: Desconectado")
+            set_state(self.arduino_status_label, 'connected', False)
     
     def check_connections(self):
         """Verificar todas as conexões periodicamente e manter Arduino vivo"""
@@ -1730,30 +1436,10 @@ class PainelPresidente(QMainWindow):
         if hasattr(self, 'server_status_label'):
             if connected:
                 self.server_status_label.setText("✅ Servidor: Online")
-                self.server_status_label.setStyleSheet("""
-                    QLabel {
-                        font-size: 14px;
-                        font-weight: bold;
-                        color: #ffffff;
-                        background-color: rgba(0, 242, 254, 0.4);
-                        border: 1px solid #00f2fe;
-                        border-radius: 8px;
-                        padding: 8px;
-                    }
-                """)
+                set_state(self.server_status_label, 'connected', True)
             else:
                 self.server_status_label.setText("❌ Servidor: Offline")
-                self.server_status_label.setStyleSheet("""
-                    QLabel {
-                        font-size: 14px;
-                        font-weight: bold;
-                        color: #ffffff;
-                        background-color: rgba(250, 112, 154, 0.4);
-                        border: 1px solid #fa709a;
-                        border-radius: 8px;
-                        padding: 8px;
-                    }
-                """)
+                set_state(self.server_status_label, 'connected', False)
         
         # 2. Atualizar Admin se estiver aberto
         if self.admin_dialog and self.admin_dialog.isVisible():
@@ -1815,6 +1501,9 @@ class PainelPresidente(QMainWindow):
         # Recarregar configuração local
         self.session_config.load_config()
         
+        # Reaplicar tema (cores da sessão podem ter mudado)
+        self.apply_styles()
+        
         # Atualizar presets de tempo na UI
         self.rebuild_preset_buttons()
         self.update_presets_state() # Garantir estado habilitado/desabilitado correto
@@ -1876,7 +1565,11 @@ class PainelPresidente(QMainWindow):
         """Abrir tela do plenário (Monitor 2)"""
         if not self.tela_plenario:
             self.tela_plenario = TelaPlenario()
+            self.tela_plenario.set_countdown(self.countdown)
             self.tela_plenario.show()
+            # Quadros da tela para OBS/gravação (/stream/plenario.mjpg)
+            self.plenario_stream = FrameStreamer(self.tela_plenario, parent=self)
+            server.set_frame_source(self.plenario_stream)
             print("✅ Tela do Plenário aberta")
     
     def sync_tela_plenario(self):
@@ -1924,6 +1617,8 @@ def main():
     # host='0.0.0.0' libera o acesso para outros computadores na mesma rede WiFi/Cabo
     server_thread = threading.Thread(target=server.run_server, kwargs={'host': '0.0.0.0', 'debug': False}, daemon=True)
     server_thread.start()
+    # Mesmo processo: comandos do painel vão direto ao servidor (sem HTTP local)
+    use_in_process_server(server.dispatch_action)
     
     # Aguardar um pouco para garantir que servidor subiu
     import time
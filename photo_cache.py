@@ -0,0 +1,279 @@
+"""
+Cache de Fotos dos Vereadores
+Miniaturas pré-escaladas em disco (AppData/fotos/.cache), LRU em memória
+e decodificação em background (QThreadPool)
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+from PySide6.QtCore import Qt, QSize, QObject, QRunnable, QThreadPool, Signal
+from PySide6.QtGui import QImage, QImageReader, QPixmap
+
+# Variantes: nome -> (tamanho em px, preencher?)
+# preencher=True  -> lado menor = tamanho (a imagem será recortada depois)
+# preencher=False -> cabe inteira em tamanho x tamanho
+VARIANTS = {
+    'card': (480, True),       # Grid do painel (recorte dinâmico por tamanho de card)
+    'circle': (200, True),     # Fotos circulares do painel "Orador em Tribuna"
+    'plenario': (280, False),  # Tela do Plenário
+    'preview': (150, False),   # Pré-visualização no Admin
+}
+
+CACHE_FOLDER = os.path.join('fotos', '.cache')
+CACHE_MAX_FILES = 2000  # Acima disso as miniaturas mais antigas são removidas na abertura
+
+
+class _DecodeTask(QRunnable):
+    """Decodifica uma variante fora da thread da GUI (QImage é thread-safe)"""
+
+    def __init__(self, cache, foto_path, variant, key):
+        super().__init__()
+        self.cache = cache
+        self.foto_path = foto_path
+        self.variant = variant
+        self.key = key
+
+    def run(self):
+        try:
+            image = self.cache.load_image(self.foto_path, self.variant, self.key)
+        except Exception as e:
+            print(f"Erro ao decodificar foto {self.foto_path}: {e}")
+            image = None
+        self.cache.image_loaded.emit(self.key, image)
+
+
+class PhotoCache(QObject):
+    """Cache de fotos chaveado por caminho, mtime e tamanho do arquivo
+
+    Decodificar um JPEG/PNG grande (ex: fotos do WhatsApp) custa dezenas de
+    milissegundos; aqui cada foto é decodificada uma vez por variante, gravada
+    como miniatura em disco e mantida decodificada em memória.
+    """
+
+    image_loaded = Signal(object, object)  # key, QImage (ou None) - vindo dos workers
+
+    def __init__(self, session_config, max_items=128):
+        super().__init__()
+        self.session_config = session_config
+        self.cache_dir = session_config.get_data_path(CACHE_FOLDER)
+        self.max_items = max_items
+        self.pixmaps = OrderedDict()  # LRU (somente thread da GUI)
+        self.pending = {}  # key -> [callbacks] aguardando decodificação
+
+        # Pool próprio para não disputar com outras tarefas do QThreadPool global
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max(1, min(4, QThreadPool.globalInstance().maxThreadCount() - 1)))
+        self.image_loaded.connect(self._on_image_loaded)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+        except OSError as e:
+            print(f"Erro ao criar cache de fotos: {e}")
+        self.prune()
+
+    def resolve(self, foto_rel):
+        """Caminho absoluto da foto (AppData primeiro, depois Bundle) ou None"""
+        if not foto_rel:
+            return None
+        foto_path = self.session_config.get_data_path(foto_rel)
+        if os.path.exists(foto_path):
+            return foto_path
+        foto_path = self.session_config.get_bundle_path(foto_rel)
+        if os.path.exists(foto_path):
+            return foto_path
+        return None
+
+    def cache_key(self, foto_path, variant):
+        """Chave (caminho, mtime, tamanho, variante); None se o arquivo sumiu"""
+        try:
+            st = os.stat(foto_path)
+        except OSError:
+            return None
+        return (os.path.normcase(foto_path), st.st_mtime_ns, st.st_size, variant)
+
+    @staticmethod
+    def thumb_name(key):
+        """<hash do caminho>_<hash da chave>_<variante>.png
+
+        O prefixo identifica a foto de origem: quando ela é trocada (novo
+        mtime/tamanho) a miniatura antiga pode ser achada e apagada.
+        """
+        path_digest = hashlib.sha1(key[0].encode('utf-8')).hexdigest()[:12]
+        key_digest = hashlib.sha1(repr(key).encode('utf-8')).hexdigest()[:12]
+        return f"{path_digest}_{key_digest}_{key[3]}.png"
+
+    def _remove_stale_thumbs(self, key):
+        """Apagar miniaturas da mesma foto/variante geradas de versões anteriores"""
+        current = self.thumb_name(key)
+        prefix = current.split('_', 1)[0] + '_'
+        suffix = f"_{key[3]}.png"
+        try:
+            entries = list(os.scandir(self.cache_dir))
+        except OSError:
+            return
+        for entry in entries:
+            if entry.name != current and entry.name.startswith(prefix) and entry.name.endswith(suffix):
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    pass
+
+    def prune(self, max_files=CACHE_MAX_FILES):
+        """Limpar o cache: temporários, nomes antigos e excesso de miniaturas"""
+        try:
+            entries = [e for e in os.scandir(self.cache_dir) if e.is_file()]
+        except OSError:
+            return
+        thumbs = []
+        for entry in entries:
+            # Formato atual: 3 partes separadas por '_' terminando em .png
+            if entry.name.endswith('.png') and entry.name.count('_') >= 2:
+                thumbs.append(entry)
+                continue
+            try:
+                os.remove(entry.path)  # .tmp órfão ou miniatura do formato antigo
+            except OSError:
+                pass
+        if len(thumbs) <= max_files:
+            return
+        thumbs.sort(key=lambda e: e.stat().st_mtime)
+        for entry in thumbs[:len(thumbs) - max_files]:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+
+    def load_image(self, foto_path, variant, key=None):
+        """Carregar QImage da variante (disco ou decodificação). Thread-safe."""
+        key = key or self.cache_key(foto_path, variant)
+        if key is None:
+            return None
+
+        thumb_path = os.path.join(self.cache_dir, self.thumb_name(key))
+
+        if os.path.exists(thumb_path):
+            image = QImage(thumb_path)
+            if not image.isNull():
+                return image
+
+        image = self._decode_scaled(foto_path, variant)
+        if image is None:
+            return None
+
+        # Gravação atômica (outro worker pode estar gravando a mesma miniatura)
+        tmp_path = f"{thumb_path}.{threading.get_ident()}.tmp"
+        try:
+            if image.save(tmp_path, 'PNG'):
+                os.replace(tmp_path, thumb_path)
+                self._remove_stale_thumbs(key)
+        except OSError as e:
+            print(f"Erro ao gravar miniatura {thumb_path}: {e}")
+        finally:
+            if os.path.exists(tmp_path):
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+        return image
+
+    def _decode_scaled(self, foto_path, variant):
+        size, fill = VARIANTS[variant]
+        mode = Qt.AspectRatioMode.KeepAspectRatioByExpanding if fill else Qt.AspectRatioMode.KeepAspectRatio
+        reader = QImageReader(foto_path)
+        reader.setAutoTransform(True)  # Respeitar orientação EXIF
+
+        # Decodificação reduzida direto no leitor (JPEG decodifica em escala;
+        # nos demais formatos o próprio leitor escala após ler)
+        original = reader.size()
+        if original.isValid():
+            target = original.scaled(QSize(size, size), mode)
+            if target.width() < original.width():
+                reader.setScaledSize(target)
+
+        image = reader.read()
+        if image.isNull():
+            return None
+
+        target = image.size().scaled(QSize(size, size), mode)
+        if target.width() < image.width():
+            image = image.scaled(target, Qt.AspectRatioMode.IgnoreAspectRatio,
+                                 Qt.TransformationMode.SmoothTransformation)
+        return image
+
+    def get_pixmap(self, foto_rel, variant):
+        """QPixmap da variante (LRU em memória). Usar apenas na thread da GUI."""
+        foto_path = self.resolve(foto_rel)
+        if not foto_path:
+            return None
+        key = self.cache_key(foto_path, variant)
+        if key is None:
+            return None
+
+        pixmap = self.pixmaps.get(key)
+        if pixmap is not None:
+            self.pixmaps.move_to_end(key)
+            return pixmap
+
+        image = self.load_image(foto_path, variant, key)
+        if image is None:
+            return None
+        pixmap = QPixmap.fromImage(image)
+        self.store_pixmap(key, pixmap)
+        return pixmap
+
+    def request_pixmap(self, foto_rel, variant, callback):
+        """Obter QPixmap sem bloquear a GUI
+
+        Se já estiver em memória, chama callback(pixmap) imediatamente e
+        retorna True. Senão, decodifica em background e chama callback(pixmap)
+        na thread da GUI quando pronto (pixmap None se a foto for inválida);
+        retorna False para o chamador exibir um placeholder enquanto isso.
+        """
+        foto_path = self.resolve(foto_rel)
+        key = self.cache_key(foto_path, variant) if foto_path else None
+        if key is None:
+            callback(None)
+            return True
+
+        pixmap = self.pixmaps.get(key)
+        if pixmap is not None:
+            self.pixmaps.move_to_end(key)
+            callback(pixmap)
+            return True
+
+        callbacks = self.pending.get(key)
+        if callbacks is not None:
+            callbacks.append(callback)  # Já em decodificação
+            return False
+        self.pending[key] = [callback]
+        self.pool.start(_DecodeTask(self, foto_path, variant, key))
+        return False
+
+    def _on_image_loaded(self, key, image):
+        pixmap = None
+        if image is not None and not image.isNull():
+            pixmap = QPixmap.fromImage(image)
+            self.store_pixmap(key, pixmap)
+        for callback in self.pending.pop(key, []):
+            try:
+                callback(pixmap)
+            except RuntimeError:
+                pass  # Widget de destino já foi destruído (ex: grid reconstruído)
+
+    def store_pixmap(self, key, pixmap):
+        self.pixmaps[key] = pixmap
+        self.pixmaps.move_to_end(key)
+        while len(self.pixmaps) > self.max_items:
+            self.pixmaps.popitem(last=False)
+
+
+_shared_cache = None
+
+def get_photo_cache(session_config):
+    """Instância compartilhada do cache (painel, plenário e admin)"""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = PhotoCache(session_config)
+    return _shared_cache
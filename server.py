@@ -1,13 +1,62 @@
 """
 Sistema de Controle de Tribuna Parlamentar
 Servidor Flask-SocketIO para comunicação com Lower Third Web
+
+Uso avulso: python server.py [--async-mode auto|eventlet|gevent|threading]
+            [--host 0.0.0.0] [--port 5000] [--no-debug]
+(ou variável PAINEL_ASYNC_MODE). Integrado ao Painel (Qt), o servidor roda
+numa thread do mesmo processo e usa sempre 'threading'.
 """
 
-from flask import Flask, render_template, jsonify, send_file
-from flask_socketio import SocketIO, emit
+import argparse
+import importlib.util
+import os
+
+ASYNC_MODES = ('auto', 'eventlet', 'gevent', 'threading')
+
+def parse_standalone_args(argv=None):
+    """Argumentos do servidor avulso"""
+    parser = argparse.ArgumentParser(description='Servidor do Lower Third / Tela do Plenário')
+    parser.add_argument('--async-mode', choices=ASYNC_MODES,
+                        default=os.getenv('PAINEL_ASYNC_MODE', 'auto'),
+                        help='Backend: green threads (eventlet/gevent) ou threads + Werkzeug')
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=5000)
+    parser.add_argument('--debug', action=argparse.BooleanOptionalAction, default=True)
+    return parser.parse_args(argv)
+
+def select_async_mode(requested):
+    """Resolver o backend pedido para um instalado ('auto': eventlet > gevent > threading)"""
+    candidates = ('eventlet', 'gevent') if requested == 'auto' else (requested,)
+    for mode in candidates:
+        if mode == 'threading' or importlib.util.find_spec(mode) is not None:
+            return mode
+    if requested != 'auto':
+        print(f"⚠️ Backend '{requested}' não instalado, usando threading")
+    return 'threading'
+
+if __name__ == '__main__':
+    # Servidor avulso: green threads exigem o monkey patch antes de importar Flask
+    STANDALONE_ARGS = parse_standalone_args()
+    ASYNC_MODE = select_async_mode(STANDALONE_ARGS.async_mode)
+    if ASYNC_MODE == 'eventlet':
+        import eventlet
+        eventlet.monkey_patch()
+    elif ASYNC_MODE == 'gevent':
+        from gevent import monkey
+        monkey.patch_all()
+else:
+    # Importado pelo Painel: a GUI Qt não convive com monkey patch
+    ASYNC_MODE = 'threading'
+
+from flask import Flask, Response, render_template, jsonify, request, send_file
+from werkzeug.security import safe_join
+from flask_socketio import SocketIO, emit, join_room
 from flask_cors import CORS
+import hashlib
 import json
-import os
+import threading
+import time
 from datetime import datetime
 import sys
 
@@ -16,117 +65,410 @@ sys.path.append(os.path.dirname(__file__))
 import logger_setup
 logger_setup.setup_logger("server")
 
-from session_config import SessionConfig
+from session_config import get_shared_config, invalidate_shared_config
+from timer_engine import CountdownTimer
+from state_store import StateStore
+from emit_coalescer import EmitCoalescer
 
 # Configuração do Flask
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'tribuna-parlamentar-2024'
 CORS(app)
-socketio = SocketIO(app, cors_allowed_origins="*", async_mode='threading')
+socketio = SocketIO(app, cors_allowed_origins="*", async_mode=ASYNC_MODE)
 
-# Estado global do sistema
-system_state = {
+# Estado global do sistema (versionado; ver state_store.StateStore)
+state_store = StateStore({
     'timer': {
         'total_seconds': 0,
         'remaining_seconds': 0,
         'is_running': False,
         'is_paused': False
     },
-    'speaker': None,
+    'speaker': None,       # Selecionado no painel (Lower Third)
+    'live_speaker': None,  # Na tribuna, como na Tela do Plenário (/plenario)
+    'aparte': False,
     'audio_muted': True,
     'delay_seconds': 10,
     'connections': {
-        'arduino': False,
-        'clients': 0
+        'arduino': False  # 'clients' fica fora do store (ver client_count)
     }
+})
+
+# Clientes Socket.IO conectados. Fora do state_store de propósito: OBS e
+# tablets reconectam com frequência e cada entrada/saída ocuparia uma versão
+# e uma posição do histórico, tirando os clientes da janela de deltas
+client_count = 0
+client_count_lock = threading.Lock()
+
+# Cronômetro autoritativo: o tempo restante é derivado do relógio monotônico,
+# então os clientes só recebem eventos nas transições e interpolam localmente
+timer = CountdownTimer()
+
+# Serializa alterações do cronômetro (ele não é thread-safe)
+timer_lock = threading.Lock()
+
+# Escrita no state_store + emissão do evento correspondente acontecem juntas
+# sob este lock: a ordem de envio segue a ordem das versões, então o cliente
+# pode descartar com segurança eventos com versão menor que a última vista.
+# Ordem de aquisição: publish_lock -> timer_lock -> lock interno do store
+publish_lock = threading.RLock()
+
+# Diferença mínima (s) para um 'update' externo gerar novo evento
+TIMER_RESYNC_THRESHOLD = 1.0
+
+# Janela de agrupamento de timer_update (rajadas de +/- tempo viram um evento).
+# PAINEL_COALESCE_MS=0 desliga
+EMIT_COALESCE_SECONDS = float(os.getenv('PAINEL_COALESCE_MS', '50')) / 1000
+
+# Fonte de quadros da Tela do Plenário (FrameStreamer), definida pelo Painel
+# quando o servidor roda no mesmo processo; None no servidor avulso
+frame_source = None
+
+# Reenvio do último quadro MJPEG quando a tela não muda (mantém OBS ativo)
+STREAM_KEEPALIVE_SECONDS = 2.0
+
+def set_frame_source(source):
+    """Registrar a fonte de quadros da Tela do Plenário"""
+    global frame_source
+    frame_source = source
+
+def current_state():
+    """Snapshot do estado (com versão) e o timer calculado no instante da chamada"""
+    version, state = state_store.snapshot()
+    return dict(state, timer=timer.snapshot(), connections=with_client_count(state['connections']),
+                version=version, epoch=state_store.epoch)
+
+def with_client_count(connections):
+    """Status de conexões com o contador de clientes atual"""
+    return dict(connections, clients=client_count)
+
+def _timer_transition(apply=None):
+    """Alterar o cronômetro (apply) e publicar seu estado no store
+
+    apply() devolve False para desistir. Retorna o payload do evento
+    (timer + versão) ou None se o estado publicado não mudou.
+    """
+    with timer_lock:
+        if apply is not None and apply() is False:
+            return None
+        version, changes = state_store.update(timer=timer.snapshot())
+    if not changes:
+        return None
+    return dict(changes['timer'], version=version)
+
+# Tópicos de eventos: cada cliente declara no connect (auth['topics']) os que
+# consome e entra numa sala por tópico; sem declaração recebe todos
+EVENT_TOPICS = {
+    'timer_start': 'timer',
+    'timer_pause': 'timer',
+    'timer_stop': 'timer',
+    'timer_update': 'timer',
+    'speaker_selected': 'speaker',
+    'speaker_cleared': 'speaker',
+    'live_speaker': 'speaker',
+    'audio_toggle': 'audio',
+    'arduino_status': 'status',
+    'config_updated': 'config',
 }
+TOPICS = frozenset(EVENT_TOPICS.values())
+
+def topic_room(topic):
+    return f'topic:{topic}'
+
+def broadcast(event, *args):
+    """Emitir evento só para os clientes inscritos no seu tópico"""
+    socketio.emit(event, *args, to=topic_room(EVENT_TOPICS[event]))
+
+# timer_update agrupado por janela; start/pause/stop saem na hora (emit_now)
+emit_coalescer = EmitCoalescer(broadcast, EMIT_COALESCE_SECONDS,
+                               socketio.start_background_task, socketio.sleep,
+                               lock=publish_lock)
+
+def client_topics(auth):
+    """Tópicos pedidos pelo cliente (todos se não informados ou inválidos)"""
+    requested = auth.get('topics') if isinstance(auth, dict) else None
+    if not isinstance(requested, (list, tuple)):
+        return TOPICS
+    topics = TOPICS.intersection(t for t in requested if isinstance(t, str))
+    return topics or TOPICS
+
+def _with_version(payload, version):
+    return dict(payload, version=version)
 
 # ===================================
 # Rotas HTTP
 # ===================================
 
+def logo_file():
+    """Caminho absoluto da logo configurada (None se não definida/encontrada)"""
+    config = get_shared_config()
+    logo_path = config.get_logo()
+    if not logo_path:
+        return None
+    if os.path.isabs(logo_path):
+        return logo_path if os.path.exists(logo_path) else None
+    # Caminho relativo: dados do usuário, depois bundle
+    for abs_path in (config.get_data_path(logo_path), config.get_bundle_path(logo_path)):
+        if os.path.exists(abs_path):
+            return abs_path
+    return None
+
+# ((caminho, mtime_ns), hash do conteúdo) da última logo lida
+_logo_hash = None
+
+def logo_hash():
+    """Hash curto do conteúdo da logo (só relê o arquivo quando ele muda)"""
+    global _logo_hash
+    path = logo_file()
+    if path is None:
+        return None
+    try:
+        key = (path, os.stat(path).st_mtime_ns)
+    except OSError:
+        return None
+    cached = _logo_hash
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    try:
+        with open(path, 'rb') as f:
+            digest = hashlib.sha1(f.read()).hexdigest()[:12]
+    except OSError:
+        return None
+    _logo_hash = (key, digest)
+    return digest
+
+def session_info():
+    config = get_shared_config()
+    return {
+        'session_name': config.get_session_name(),
+        'session_number': config.get_session_name(), # Fallback de compatibilidade
+        'city_name': config.get_city_name()
+    }
+
+# (config, hash da logo, payload, corpo JSON) do último bootstrap montado
+_bootstrap_cache = None
+
+def _bootstrap_entry():
+    """(payload, corpo JSON pré-serializado) do bootstrap atual"""
+    global _bootstrap_cache
+    config = get_shared_config()
+    digest = logo_hash()
+    cached = _bootstrap_cache
+    if cached is not None and cached[0] is config and cached[1] == digest:
+        return cached[2], cached[3]
+
+    payload = {
+        'colors': config.get_colors(),
+        'session': session_info(),
+        'logo_url': f'/api/session/logo?v={digest}' if digest else None,
+    }
+    encoded = json.dumps(payload, sort_keys=True).encode('utf-8')
+    payload['version'] = hashlib.sha1(encoded).hexdigest()[:12]
+    body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+    _bootstrap_cache = (config, digest, payload, body)
+    return payload, body
+
+def bootstrap_config():
+    """Cores, info da sessão e URL da logo (com hash), com versão
+
+    A versão muda apenas quando algum desses dados muda, então o cliente pode
+    ignorar um bootstrap repetido; a URL da logo muda junto com o arquivo.
+    """
+    return _bootstrap_entry()[0]
+
 @app.route('/api/session/logo')
 def get_session_logo():
-    """Servir a logo configurada na sessão"""
+    """Servir a logo configurada na sessão (?v=<hash> permite cache longo)"""
     try:
-        config = SessionConfig()
-        logo_path = config.get_logo()
-        
-        if logo_path:
-            # Se for caminho relativo, converter para absoluto nos dados do usuário
-            if not os.path.isabs(logo_path):
-                abs_path = config.get_data_path(logo_path)
-                if os.path.exists(abs_path):
-                    return send_file(abs_path)
-                # Tentar bundle se não estiver em dados
-                abs_path = config.get_bundle_path(logo_path)
-                if os.path.exists(abs_path):
-                    return send_file(abs_path)
-            elif os.path.exists(logo_path):
-                return send_file(logo_path)
-                
+        config = get_shared_config()
+        if not config.get_logo():
+            return "Logo não definida", 404
+        path = logo_file()
+        if path is None:
             return "Logo não encontrada", 404
+        response = send_file(path, conditional=True)
+        version = request.args.get('v')
+        if version and version == logo_hash():
+            response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
         else:
-            return "Logo não definida", 404
+            response.headers['Cache-Control'] = 'no-cache'
+        return response
     except Exception as e:
         return str(e), 500
 
 @app.route('/api/session/info')
 def get_session_info():
     """Obter informações da sessão"""
-    config = SessionConfig()
-    return jsonify({
-        'session_name': config.get_session_name(),
-        'session_number': config.get_session_name() # Fallback de compatibilidade
-    })
+    return jsonify(session_info())
 
 @app.route('/api/session/colors')
 def get_session_colors():
     """Obter cores do tema"""
-    config = SessionConfig()
-    return jsonify(config.get_colors())
+    return jsonify(get_shared_config().get_colors())
+
+@app.route('/api/bootstrap')
+def get_bootstrap():
+    """Configuração de um overlay: cores, sessão e logo (ETag = versão; 304 se igual)
+
+    A carga inicial é dividida em duas: a configuração vem daqui e o estado
+    ao vivo (cronômetro, orador, áudio) vem no state_update/state_delta do
+    Socket.IO ou em /api/state. Sem o estado, que muda a cada transição, a
+    resposta só muda com a configuração e pode ser revalidada pelo cache do
+    navegador.
+    """
+    payload, body = _bootstrap_entry()
+    response = Response(body, mimetype='application/json')
+    response.set_etag(payload['version'])
+    response.headers['Cache-Control'] = 'no-cache'  # Sempre revalidar
+    return response.make_conditional(request)
+
+# Lista de vereadores já serializada: ((caminho, mtime_ns), (dados, corpo JSON, ETag))
+_vereadores_cache = None
+
+def _active_list_file():
+    """Arquivo da lista ativa (AppData, senão bundle) e seu mtime"""
+    config = get_shared_config()
+    active_list = config.get_active_list()
+    for json_path in (config.get_data_path(active_list), config.get_bundle_path(active_list)):
+        try:
+            return json_path, os.stat(json_path).st_mtime_ns
+        except OSError:
+            continue
+    return None, None
+
+def cached_vereadores():
+    """(dados, corpo JSON, ETag) da lista ativa; o arquivo só é relido quando muda"""
+    global _vereadores_cache
+    key = _active_list_file()
+    cached = _vereadores_cache
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    data = []
+    if key[0]:
+        try:
+            with open(key[0], 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception:
+            # Ex: arquivo pela metade enquanto o admin salva. Não guardar no
+            # cache (o mtime pode não mudar de novo): a próxima chamada relê
+            if cached is not None:
+                return cached[1]
+            return _vereadores_entry([])
+    entry = _vereadores_entry(data)
+    _vereadores_cache = (key, entry)  # Troca atômica: leitores não precisam de lock
+    return entry
+
+def _vereadores_entry(data):
+    """(dados, corpo JSON, ETag) de uma lista"""
+    body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+    return data, body, hashlib.sha1(body).hexdigest()
 
 def load_vereadores():
     """Carrega lista de vereadores do JSON (usa AppData)"""
-    config = SessionConfig()
-    active_list = config.get_active_list()
-    json_path = config.get_data_path(active_list)
-    try:
-        if os.path.exists(json_path):
-            with open(json_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        # Tentar bundle como fallback
-        json_path = config.get_bundle_path(active_list)
-        if os.path.exists(json_path):
-             with open(json_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        return []
-    except Exception:
-        return []
+    return cached_vereadores()[0]
 
 @app.route('/')
 def index():
     """Página principal - Lower Third"""
     return render_template('lower_third.html')
 
+@app.route('/plenario')
+def plenario():
+    """Tela do Plenário para TVs da rede (mesmos estados da tela desktop)"""
+    return render_template('plenario.html')
+
+# Extensões servidas por /api/foto (qualquer outro arquivo dá 404)
+FOTO_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp', '.gif')
+
+@app.route('/api/foto/<path:foto>')
+def get_foto(foto):
+    """Servir foto de vereador pelo caminho relativo do JSON (ex: fotos/joao.jpg)
+
+    Só imagens da pasta fotos/ (AppData, senão bundle): o resto da pasta de
+    dados (configuração, listas) não fica exposto na rede.
+    """
+    if not foto.lower().endswith(FOTO_EXTENSIONS):
+        return "Foto não encontrada", 404
+    if foto.startswith('fotos/'):
+        foto = foto[len('fotos/'):]
+    config = get_shared_config()
+    for base in (config.get_data_path('fotos'), config.get_bundle_path('fotos')):
+        foto_path = safe_join(base, foto)  # Bloqueia caminhos fora da pasta
+        if foto_path and os.path.isfile(foto_path):
+            return send_file(foto_path)
+    return "Foto não encontrada", 404
+
+@app.route('/stream/plenario.mjpg')
+def stream_plenario():
+    """Tela do Plenário em MJPEG (OBS: fonte de mídia/navegador). ?fps=N reduz a taxa"""
+    source = frame_source
+    if source is None:
+        return "Tela do Plenário indisponível", 503
+    fps = request.args.get('fps', type=float) or source.fps
+    interval = 1.0 / max(0.5, min(fps, source.fps))
+
+    def generate():
+        source.subscribe()
+        try:
+            seq = -1
+            while True:
+                sent_at = time.monotonic()
+                seq, jpeg = source.wait_frame(seq, STREAM_KEEPALIVE_SECONDS)
+                if jpeg is None:
+                    continue  # Primeira captura ainda não saiu
+                yield (b'--frame\r\nContent-Type: image/jpeg\r\nContent-Length: '
+                       + str(len(jpeg)).encode() + b'\r\n\r\n' + jpeg + b'\r\n')
+                # Limitar a taxa deste cliente
+                delay = interval - (time.monotonic() - sent_at)
+                if delay > 0:
+                    time.sleep(delay)
+        finally:
+            source.unsubscribe()
+
+    return Response(generate(), mimetype='multipart/x-mixed-replace; boundary=frame',
+                    headers={'Cache-Control': 'no-cache'})
+
+@app.route('/stream/plenario.png')
+def snapshot_plenario():
+    """Quadro atual da Tela do Plenário em PNG"""
+    source = frame_source
+    if source is None:
+        return "Tela do Plenário indisponível", 503
+    png = source.snapshot_png()
+    if png is None:
+        return "Quadro indisponível", 503
+    return Response(png, mimetype='image/png', headers={'Cache-Control': 'no-cache'})
+
+@app.route('/api/plenario/background')
+def get_plenario_background():
+    """Imagem de fundo da Tela do Plenário"""
+    bg_path = os.path.join(os.path.dirname(__file__), "fotos", "Cópia de TELA DE TEMPO.png")
+    if os.path.exists(bg_path):
+        return send_file(bg_path)
+    return "Fundo não encontrado", 404
+
 @app.route('/api/vereadores')
 def get_vereadores():
-    """API para obter lista de vereadores"""
-    return jsonify(load_vereadores())
+    """API para obter lista de vereadores (ETag forte: 304 se o cliente já tem a lista)"""
+    data, body, etag = cached_vereadores()
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'  # Sempre revalidar
+    return response.make_conditional(request)
 
 @app.route('/api/state')
 def get_state():
     """API para obter estado atual do sistema"""
-    return jsonify(system_state)
+    return jsonify(current_state())
 
 @app.route('/api/config')
 def get_config():
     """API para obter configurações"""
     return jsonify({
-        'delay_seconds': system_state['delay_seconds']
+        'delay_seconds': state_store.get('delay_seconds')
     })
 
-from flask import request
 
 # ===================================
 # Rotas de Controle HTTP (API para o Desktop)
@@ -135,102 +477,231 @@ from flask import request
 @app.route('/api/action/timer', methods=['POST'])
 def action_timer():
     """Receber comando do timer via HTTP"""
-    data = request.json
-    action = data.get('action') # start, pause, stop, update
-    
-    if action == 'start':
-        server_update_timer(True, False, data.get('remaining'), data.get('total'))
-    elif action == 'pause':
-        server_update_timer(False, True, data.get('remaining'))
-    elif action == 'stop':
-        server_update_timer(False, False, data.get('total'), data.get('total'))
-    elif action == 'update':
-        server_update_timer(True, False, data.get('remaining'))
-        
+    dispatch_action('timer', request.get_json(silent=True) or {})
     return jsonify({'status': 'ok'})
 
 @app.route('/api/action/speaker', methods=['POST'])
 def action_speaker():
     """Receber orador via HTTP"""
-    data = request.json
-    speaker = data.get('speaker')
-    server_update_speaker(speaker)
+    dispatch_action('speaker', request.get_json(silent=True) or {})
     return jsonify({'status': 'ok'})
 
 @app.route('/api/action/audio', methods=['POST'])
 def action_audio():
     """Controle de áudio via HTTP"""
-    data = request.json
-    server_update_audio(data.get('muted'))
+    dispatch_action('audio', request.get_json(silent=True) or {})
     return jsonify({'status': 'ok'})
 
 @app.route('/api/action/arduino', methods=['POST'])
 def action_arduino():
     """Status arduino via HTTP"""
-    data = request.json
-    server_update_arduino(data.get('connected'))
+    dispatch_action('arduino', request.get_json(silent=True) or {})
     return jsonify({'status': 'ok'})
 
 @app.route('/api/action/config_update', methods=['POST'])
 def action_config_update():
     """Notificar atualização de configuração"""
-    socketio.emit('config_updated')
+    dispatch_action('config_update', request.get_json(silent=True) or {})
     return jsonify({'status': 'ok'})
 
+# ===================================
+# Despacho de Ações (HTTP e In-Process)
+# ===================================
+
+def _action_timer(data):
+    action = data.get('action') # start, pause, stop, adjust, update
+
+    if action == 'start':
+        server_update_timer(True, False, data.get('remaining'), data.get('total'))
+    elif action == 'pause':
+        server_update_timer(False, True, data.get('remaining'))
+    elif action == 'stop':
+        server_update_timer(False, False, data.get('total'), data.get('total'))
+    elif action == 'adjust':
+        server_adjust_timer(data.get('remaining'), data.get('total'))
+    elif action == 'update':
+        # Compatibilidade: controladores antigos enviam o restante a cada segundo
+        if timer.is_running:
+            server_adjust_timer(data.get('remaining'), resync_only=True)
+        else:
+            server_update_timer(True, False, data.get('remaining'))
+
+def _action_speaker(data):
+    server_update_speaker(data.get('speaker'), data.get('aparte', False), data.get('live', False))
+
+def _action_audio(data):
+    server_update_audio(data.get('muted'))
+
+def _action_arduino(data):
+    server_update_arduino(data.get('connected'))
+
+def _action_config_update(data):
+    invalidate_shared_config()  # Garante a releitura mesmo com mtime de baixa resolução
+    broadcast('config_updated')
+
+ACTIONS = {
+    'timer': _action_timer,
+    'speaker': _action_speaker,
+    'audio': _action_audio,
+    'arduino': _action_arduino,
+    'config_update': _action_config_update,
+}
+
+def dispatch_action(endpoint, data):
+    """Executa uma ação de /api/action/<endpoint> sem passar por HTTP
+
+    Usado pelas rotas HTTP (controladores externos) e diretamente pelo
+    Painel quando o servidor roda no mesmo processo.
+    """
+    handler = ACTIONS.get(endpoint)
+    if handler is None:
+        raise KeyError(f"Ação desconhecida: {endpoint}")
+    handler(data or {})
+
 # ===================================
 # Funções Internas de Atualização
 # ===================================
 
 def server_update_timer(is_running, is_paused, remaining, total=None):
-    """Atualiza estado do timer e emite evento"""
-    system_state['timer']['is_running'] = is_running
-    system_state['timer']['is_paused'] = is_paused
-    system_state['timer']['remaining_seconds'] = remaining
-    if total is not None:
-        system_state['timer']['total_seconds'] = total
-    
-    event = 'timer_update'
-    if is_running: event = 'timer_start'
-    elif is_paused: event = 'timer_pause'
-    elif not is_running and not is_paused and remaining == system_state['timer']['total_seconds']: event = 'timer_stop'
-    
-    socketio.emit(event, system_state['timer'])
-    # socketio.emit('state_update', system_state) # Opcional, mas carrega network
-
-def server_update_speaker(speaker_data):
-    """Atualiza orador e emite evento"""
-    system_state['speaker'] = speaker_data
-    if speaker_data:
-        socketio.emit('speaker_selected', {'speaker': speaker_data, 'nome': speaker_data.get('nome')})
+    """Atualiza estado do timer e emite evento (apenas em transições)"""
+    if is_running:
+        event = 'timer_start'
+        apply = lambda: timer.start(remaining, total)
+    elif is_paused:
+        event = 'timer_pause'
+        apply = lambda: timer.pause(remaining)
     else:
-        socketio.emit('speaker_selected', {'speaker': None}) # Front espera speaker: null
-        # Ou speaker_cleared
-        socketio.emit('speaker_cleared')
+        event = 'timer_stop'
+        apply = lambda: timer.stop(total if total is not None else remaining)
+
+    with publish_lock:
+        if is_running:
+            # Quem está selecionado ao iniciar passa a ser o orador na tribuna
+            server_update_live_speaker(state_store.get('speaker'))
+
+        # Transição: entregue já e na ordem (descarta timer_update pendente)
+        emit_coalescer.emit_now('timer', event, lambda: _timer_transition(apply))
+    # socketio.emit('state_update', current_state()) # Opcional, mas carrega network
+
+def server_adjust_timer(remaining, total=None, resync_only=False):
+    """Corrige restante/total (acréscimo ou desconto de tempo) sem mudar o estado"""
+    if remaining is None:
+        return
+
+    with timer_lock:
+        if resync_only and abs(timer.remaining() - remaining) < TIMER_RESYNC_THRESHOLD:
+            return  # Clientes já interpolam esse valor, não precisa emitir
+        timer.set_remaining(remaining)
+        if total is not None:
+            timer.total_seconds = total
+
+    # Publicado e emitido ao fim da janela, com o valor de então: N cliques
+    # seguidos viram um só evento (e nenhum, se o saldo for zero)
+    emit_coalescer.submit('timer', 'timer_update', _timer_transition)
+
+def server_update_live_speaker(speaker_data):
+    """Orador na tribuna (o que a Tela do Plenário mostra); emite se mudou"""
+    with publish_lock:
+        version, changes = state_store.update(live_speaker=speaker_data)
+        if changes:
+            broadcast('live_speaker', {'speaker': speaker_data, 'aparte': state_store.get('aparte'), 'version': version})
+
+def server_update_speaker(speaker_data, aparte=False, live=False):
+    """Atualiza orador (e se está em aparte) e emite evento
+
+    Como na Tela do Plenário, o orador na tribuna só acompanha a seleção com
+    o cronômetro parado (clicar noutro card durante o discurso não o troca),
+    ou quando o painel indica que o selecionado passa a falar (live, ex: aparte).
+    """
+    aparte = bool(aparte) and bool(speaker_data)
+    fields = {'speaker': speaker_data, 'aparte': aparte}
+    with publish_lock:
+        with timer_lock:
+            running = timer.is_running
+        if live or not running:
+            fields['live_speaker'] = speaker_data
+        version, changes = state_store.update(**fields)
+        if 'live_speaker' in changes or 'aparte' in changes:
+            live_speaker = state_store.snapshot()[1]['live_speaker']
+            broadcast('live_speaker', {'speaker': live_speaker, 'aparte': aparte, 'version': version})
+        if speaker_data:
+            broadcast('speaker_selected', _with_version({'speaker': speaker_data, 'nome': speaker_data.get('nome'), 'aparte': aparte}, version))
+        else:
+            broadcast('speaker_selected', _with_version({'speaker': None, 'aparte': False}, version)) # Front espera speaker: null
+            # Ou speaker_cleared
+            broadcast('speaker_cleared')
 
 def server_update_audio(muted):
     """Atualiza áudio e emite evento"""
-    system_state['audio_muted'] = muted
-    socketio.emit('audio_toggle', {'muted': muted})
+    with publish_lock:
+        version, _ = state_store.update(audio_muted=muted)
+        broadcast('audio_toggle', _with_version({'muted': muted}, version))
 
 def server_update_arduino(connected):
     """Atualiza status arduino"""
-    system_state['connections']['arduino'] = connected
-    socketio.emit('arduino_status', {'connected': connected})
+    with publish_lock:
+        version, _ = state_store.modify(lambda state: {
+            'connections': dict(state['connections'], arduino=connected)
+        })
+        broadcast('arduino_status', _with_version({'connected': connected}, version))
+
+def _count_client(delta):
+    """Somar delta ao contador de clientes e devolver o total (não gera versão)"""
+    global client_count
+    with client_count_lock:
+        client_count = max(0, client_count + delta)
+        return client_count
 
 # ===================================
 # WebSocket Events (Client-Side)
 # ===================================
 
+def resync_payload(auth):
+    """Deltas perdidos por um cliente que reconecta, ou None (mandar snapshot)
+
+    O cliente informa em `auth` a execução do servidor ('epoch'), a última
+    versão vista ('version') e a do bootstrap ('bootstrap'); recebe só os
+    campos alterados desde então.
+    """
+    if not isinstance(auth, dict) or auth.get('epoch') != state_store.epoch:
+        return None
+    last = auth.get('version')
+    if not isinstance(last, int) or isinstance(last, bool):
+        return None
+    missed = state_store.changes_since(last)
+    if missed is None:
+        return None
+    version, changes = missed
+    if 'timer' in changes:
+        changes = dict(changes, timer=timer.snapshot())  # Restante de agora, não o da transição
+    if 'connections' in changes:
+        changes = dict(changes, connections=with_client_count(changes['connections']))
+    payload = {'from': last, 'version': version, 'changes': changes}
+    bootstrap = bootstrap_config()
+    if auth.get('bootstrap') != bootstrap['version']:
+        payload['bootstrap'] = bootstrap
+    return payload
+
 @socketio.on('connect')
-def handle_connect():
-    system_state['connections']['clients'] += 1
-    print(f"✅ Cliente conectado. Total: {system_state['connections']['clients']}")
-    emit('state_update', system_state)
+def handle_connect(auth=None):
+    total = _count_client(1)
+    print(f"✅ Cliente conectado. Total: {total}")
+    # Sob publish_lock: nenhum evento com versão posterior ao snapshot/delta
+    # chega a este cliente antes dele (nem um anterior depois)
+    with publish_lock:
+        for topic in client_topics(auth):
+            join_room(topic_room(topic))
+        delta = resync_payload(auth)
+        if delta is not None:
+            emit('state_delta', delta)
+        else:
+            # Bootstrap embutido: o overlay não precisa de outras requisições
+            emit('state_update', dict(current_state(), bootstrap=bootstrap_config()))
 
 @socketio.on('disconnect')
 def handle_disconnect():
-    system_state['connections']['clients'] -= 1
-    print(f"❌ Cliente desconectado. Total: {system_state['connections']['clients']}")
+    total = _count_client(-1)
+    print(f"❌ Cliente desconectado. Total: {total}")
 
 # Mantemos os handlers antigos para compatibilidade caso algum cliente tente enviar
 @socketio.on('timer_start')
@@ -239,7 +710,7 @@ def handle_timer_start(data):
 
 @socketio.on('timer_stop')
 def handle_timer_stop():
-    server_update_timer(False, False, system_state['timer']['total_seconds'])
+    server_update_timer(False, False, timer.total_seconds)
 
 def run_server(host='0.0.0.0', port=5000, debug=False):
     print(f"""
@@ -249,11 +720,18 @@ def run_server(host='0.0.0.0', port=5000, debug=False):
 ║  Servidor Flask-SocketIO iniciado                           ║
 ║  URL: http://{host}:{port}                            ║
 ║  Lower Third: http://{host}:{port}/                   ║
+║  Plenário: http://{host}:{port}/plenario              ║
+║  Backend: {socketio.async_mode:<50} ║
 ║                                                              ║
 ║  Pressione Ctrl+C para encerrar                             ║
 ╚══════════════════════════════════════════════════════════════╝
     """)
-    socketio.run(app, host=host, port=port, debug=debug, allow_unsafe_werkzeug=True)
+    if socketio.async_mode == 'threading':
+        # Servidor de desenvolvimento do Werkzeug (uma thread por cliente)
+        socketio.run(app, host=host, port=port, debug=debug, allow_unsafe_werkzeug=True)
+    else:
+        # Servidor WSGI do eventlet/gevent: clientes em green threads
+        socketio.run(app, host=host, port=port, debug=debug)
 
 if __name__ == '__main__':
-    run_server(debug=True)
+    run_server(STANDALONE_ARGS.host, STANDALONE_ARGS.port, STANDALONE_ARGS.debug)
@@ -2,10 +2,12 @@
 Configuração de Sessão - Logo e Número da Sessão
 """
 
+import copy
 import json
 import os
 import sys
 import shutil
+import threading
 
 class SessionConfig:
     """Gerenciador de configuração da sessão"""
@@ -212,3 +214,59 @@ class SessionConfig:
         if not relative_path:
             return self.base_bundle_path
         return os.path.join(self.base_bundle_path, relative_path)
+
+
+# ===================================
+# Configuração compartilhada (servidor)
+# ===================================
+
+# (mtime_ns do session_config.json, SessionConfig) — trocado por inteiro a cada
+# recarga, então leitores nunca veem um objeto pela metade e não precisam de lock
+_shared = None
+_shared_lock = threading.Lock()
+
+
+def _config_mtime(config_path):
+    try:
+        return os.stat(config_path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def get_shared_config():
+    """SessionConfig do processo, somente leitura
+
+    Criado uma única vez (pastas e cópias do bundle só na primeira chamada) e
+    recarregado apenas quando o session_config.json muda no disco. Para
+    alterar a configuração use uma instância própria de SessionConfig.
+    """
+    global _shared
+    shared = _shared
+    if shared is not None and _config_mtime(shared[1].config_path) == shared[0]:
+        return shared[1]
+
+    with _shared_lock:
+        shared = _shared
+        # O mtime é lido ANTES do JSON: uma gravação entre os dois muda o
+        # mtime de novo e é relida na próxima chamada (nunca fica perdida)
+        if shared is None:
+            config = SessionConfig()
+            mtime = _config_mtime(config.config_path)
+            config.load_config()
+        else:
+            mtime = _config_mtime(shared[1].config_path)
+            if mtime == shared[0]:
+                return shared[1]  # Outra thread já recarregou
+            # Só reler o JSON: a estrutura de pastas já foi inicializada
+            config = copy.copy(shared[1])
+            config.load_config()
+        _shared = (mtime, config)
+        return config
+
+
+def invalidate_shared_config():
+    """Forçar releitura na próxima chamada (ex: aviso de config_update)"""
+    global _shared
+    with _shared_lock:
+        if _shared is not None:
+            _shared = (None, _shared[1])
@@ -0,0 +1,88 @@
+"""
+Estado Versionado do Servidor
+Snapshots imutáveis (copy-on-write): escritas são serializadas por um lock e
+publicam um novo dicionário com versão crescente; leituras apenas pegam a
+referência atual, sem lock, e nunca veem um estado pela metade. As últimas
+mudanças ficam num buffer circular para ressincronizar clientes reconectados
+"""
+
+import threading
+import uuid
+from collections import deque
+
+STATE_HISTORY = 256  # Escritas lembradas para ressincronização por deltas
+
+
+class StateStore:
+    """Estado do sistema com versão e conjunto de mudanças por escrita
+
+    Os dicionários devolvidos são compartilhados entre threads e devem ser
+    tratados como somente leitura; para alterar use update() ou modify().
+    """
+
+    def __init__(self, initial, history=STATE_HISTORY):
+        self._lock = threading.Lock()
+        # Identifica este processo: versões de outra execução não são comparáveis
+        self.epoch = uuid.uuid4().hex[:12]
+        self._current = (0, dict(initial))  # (versão, estado)
+        self._history = deque(maxlen=history)  # (versão, mudanças) por escrita
+
+    @property
+    def version(self):
+        return self._current[0]
+
+    def snapshot(self):
+        """(versão, estado) consistentes entre si"""
+        return self._current
+
+    def get(self, key, default=None):
+        return self._current[1].get(key, default)
+
+    def update(self, **fields):
+        """Substituir campos de primeiro nível
+
+        Retorna (versão, mudanças): só os campos cujo valor mudou. Sem
+        mudanças a versão não avança e o dicionário vem vazio.
+        """
+        with self._lock:
+            return self._publish(fields)
+
+    def changes_since(self, version):
+        """Mudanças acumuladas depois de `version`: (versão atual, campos)
+
+        Retorna None quando o cliente saiu da janela do histórico ou a versão
+        não pertence a este processo (ex: servidor reiniciado); nesses casos
+        é preciso enviar o snapshot completo.
+        """
+        with self._lock:
+            current = self._current[0]
+            if version == current:
+                return current, {}
+            if version > current or not self._history or self._history[0][0] > version + 1:
+                return None
+            merged = {}
+            for entry_version, changes in self._history:
+                if entry_version > version:
+                    merged.update(changes)  # Só o valor mais recente de cada campo
+            return current, merged
+
+    def modify(self, fn):
+        """Leitura-e-escrita atômica: fn(estado) devolve os campos a substituir
+
+        Ex: incrementar contadores sem perder atualizações concorrentes.
+        """
+        with self._lock:
+            return self._publish(fn(self._current[1]))
+
+    def _publish(self, fields):
+        version, state = self._current
+        changes = {key: value for key, value in fields.items()
+                   if key not in state or state[key] != value}
+        if not changes:
+            return version, {}
+        new_state = dict(state)
+        new_state.update(changes)
+        version += 1
+        self._current = (version, new_state)  # Troca atômica da referência
+        self._history.append((version, changes))
+        return version, changes
@@ -0,0 +1,48 @@
+/*
+ * Modelo local do cronômetro
+ * O servidor só emite eventos nas transições (start, pause, stop, ajuste);
+ * o tempo restante é interpolado aqui com o relógio monotônico do navegador.
+ */
+(function (global) {
+    function TimerModel() {
+        this.apply({});
+    }
+
+    // Aplicar estado recebido (timer_start/pause/stop/update ou state.timer)
+    TimerModel.prototype.apply = function (timer) {
+        timer = timer || {};
+        const exact = timer.remaining_exact;
+        this.totalSeconds = timer.total_seconds || 0;
+        this.remainingAtAnchor = (exact !== undefined && exact !== null) ? exact : (timer.remaining_seconds || 0);
+        this.isRunning = !!timer.is_running;
+        this.isPaused = !!timer.is_paused;
+        this.anchor = performance.now();
+    };
+
+    // Tempo restante exato (segundos, float)
+    TimerModel.prototype.remaining = function () {
+        if (!this.isRunning) return this.remainingAtAnchor;
+        const elapsed = (performance.now() - this.anchor) / 1000;
+        return Math.max(0, this.remainingAtAnchor - elapsed);
+    };
+
+    // Segundos inteiros arredondados para cima (igual ao painel)
+    TimerModel.prototype.remainingSeconds = function () {
+        return Math.ceil(this.remaining() - 1e-6);
+    };
+
+    // Fração restante (0..1) para barras de progresso
+    TimerModel.prototype.progress = function () {
+        if (!this.totalSeconds) return 0;
+        return Math.min(1, this.remaining() / this.totalSeconds);
+    };
+
+    TimerModel.prototype.format = function () {
+        const s = this.remainingSeconds();
+        const mm = String(Math.floor(s / 60)).padStart(2, '0');
+        const ss = String(s % 60).padStart(2, '0');
+        return mm + ':' + ss;
+    };
+
+    global.TimerModel = TimerModel;
+})(window);
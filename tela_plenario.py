@@ -4,13 +4,26 @@ Exibição fullscreen de foto, nome, partido e cronômetro
 """
 
 import sys
-from PySide6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QProgressBar
-from PySide6.QtCore import Qt, QTimer, Slot, QDate, QLocale
-from PySide6.QtGui import QFont, QPixmap, QScreen
+from PySide6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel
+from PySide6.QtCore import Qt, Slot, QDate, QLocale, QRectF
+from PySide6.QtGui import QFont, QPainter, QPixmap, QScreen
 import os
+import time
+
+from photo_cache import get_photo_cache
+from timer_display import BigTimerDisplay, SmoothProgressBar
+from blink_animation import BlinkAnimation
 
 class TelaPlenario(QMainWindow):
     """Janela fullscreen para exibição no plenário"""
+
+    # Cores do cronômetro
+    COLOR_NORMAL = '#ffffff'
+    COLOR_APARTE = '#fceabb'
+    COLOR_ALERTA = '#ff0000'
+    BLINK_OFF_OPACITY = 0.1
+    PROGRESS_FPS = 30  # Limite de quadros da barra de progresso
+    PHOTO_RECHECK_SECONDS = 5.0  # Foto trocada no disco com o mesmo orador
     
 
     
@@ -95,8 +108,9 @@ class TelaPlenario(QMainWindow):
         
         # --- CONTAINER DO TIMER (Estilo Refined) ---
         self.timer_container = QWidget()
+        self.timer_container.setObjectName("timerContainer")
         self.timer_container.setStyleSheet("""
-            QWidget {
+            QWidget#timerContainer {
                 background: rgba(30, 144, 255, 0.15);
                 border: 2px solid rgba(255, 255, 255, 0.5);
                 border-radius: 30px;
@@ -106,38 +120,16 @@ class TelaPlenario(QMainWindow):
         timer_layout.setContentsMargins(40, 5, 40, 15)
         timer_layout.setSpacing(0)
         
-        # Cronômetro Texto
-        self.timer_label = QLabel("00:00")
-        self.timer_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.timer_label.setStyleSheet("""
-            QLabel {
-                font-size: 210px;
-                font-weight: bold;
-                color: #ffffff;
-                background: transparent;
-                border: none;
-                font-family: 'Segoe UI', sans-serif;
-                margin-bottom: -10px; /* Ajuste fino */
-            }
-        """)
+        # Cronômetro (dígitos pintados com glifos em cache)
+        self.timer_label = BigTimerDisplay("00:00", 210)
         timer_layout.addWidget(self.timer_label)
         
-        # Barra de Progresso
-        self.progress_bar = QProgressBar()
+        # Piscar no último minuto (opacidade animada, ver update_timer)
+        self.blink = BlinkAnimation(self.timer_label, self.BLINK_OFF_OPACITY)
+        
+        # Barra de Progresso (pintada; anda suave com o cronômetro, ver set_countdown)
+        self.progress_bar = SmoothProgressBar(fps=self.PROGRESS_FPS)
         self.progress_bar.setFixedHeight(12)
-        self.progress_bar.setTextVisible(False)
-        self.progress_bar.setValue(0)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: none;
-                border-radius: 6px;
-                background-color: rgba(0, 0, 0, 0.3);
-            }
-            QProgressBar::chunk {
-                background-color: #00f2fe;
-                border-radius: 6px;
-            }
-        """)
         timer_layout.addWidget(self.progress_bar)
         
         main_layout.addWidget(self.timer_container, 0, Qt.AlignmentFlag.AlignCenter)
@@ -151,15 +143,9 @@ class TelaPlenario(QMainWindow):
         
         central_widget.setLayout(main_layout)
         
-        # Aplicar estilo global (Imagem de fundo)
+        # Imagem de fundo: carregada uma vez, pré-escalada por geometria (ver paintEvent)
         bg_path = os.path.join(os.path.dirname(__file__), "fotos", "Cópia de TELA DE TEMPO.png")
-        bg_path = bg_path.replace("\\", "/")
-        
-        self.setStyleSheet(f"""
-            QMainWindow {{
-                border-image: url("{bg_path}") 0 0 0 0 stretch stretch;
-            }}
-        """)
+        self.background_source = QPixmap(bg_path) if os.path.exists(bg_path) else None
         
         # Fullscreen
         self.showFullScreen()
@@ -196,6 +182,42 @@ class TelaPlenario(QMainWindow):
             print(f"✅ Tela do Plenário movida para Monitor 2: {second_screen.name()}")
         else:
             print("⚠️ Apenas um monitor detectado. Tela do Plenário no monitor principal.")
+        
+        # Outro monitor pode ter outra resolução/escala: refazer o fundo já
+        self.background_key = None
+        self.scaled_background()
+
+    def scaled_background(self):
+        """Fundo escalado para a janela atual (refeito só se tamanho ou escala mudarem)"""
+        if self.background_source is None or self.background_source.isNull():
+            return None
+        dpr = self.devicePixelRatioF()
+        key = (self.width(), self.height(), dpr)
+        if key != self.background_key:
+            pixmap = self.background_source.scaled(
+                round(self.width() * dpr), round(self.height() * dpr),
+                Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation)
+            pixmap.setDevicePixelRatio(dpr)
+            self.background_pixmap = pixmap
+            self.background_key = key
+        return self.background_pixmap
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.scaled_background()
+
+    def paintEvent(self, event):
+        """Desenhar só a região suja do fundo já escalado (sem reescalar a imagem)"""
+        background = self.scaled_background()
+        if background is None:
+            super().paintEvent(event)
+            return
+        rect = event.rect()
+        dpr = background.devicePixelRatio()
+        source = QRectF(rect.x() * dpr, rect.y() * dpr, rect.width() * dpr, rect.height() * dpr)
+        painter = QPainter(self)
+        painter.drawPixmap(QRectF(rect), background, source)
+        painter.end()
     
     def set_placeholder_photo(self):
         """Definir foto placeholder"""
@@ -210,9 +232,35 @@ class TelaPlenario(QMainWindow):
             }
         """)
     
+    def _render_fingerprint(self, vereador):
+        """Identidade do que está desenhado: modo, orador, textos e mtime da foto"""
+        if not vereador:
+            return ('orador', None)
+        foto = vereador.get('foto')
+        return ('orador', vereador.get('id'), vereador.get('nome'), vereador.get('partido'), foto,
+                self._foto_mtime(vereador.get('id'), foto))
+
+    def _foto_mtime(self, vereador_id, foto):
+        """mtime da foto, consultado no disco só ao trocar de orador/foto ou a
+        cada PHOTO_RECHECK_SECONDS (update_vereador roda a cada tick)"""
+        now = time.monotonic()
+        key = (vereador_id, foto)
+        stamp = self.foto_stamp
+        if stamp is not None and stamp[0] == key and now - stamp[2] < self.PHOTO_RECHECK_SECONDS:
+            return stamp[1]
+        foto_mtime = None
+        foto_path = self.photo_cache.resolve(foto)
+        if foto_path:
+            try:
+                foto_mtime = os.stat(foto_path).st_mtime_ns
+            except OSError:
+                pass
+        self.foto_stamp = (key, foto_mtime, now)
+        return foto_mtime
+
     @Slot(dict)
     def update_vereador(self, vereador):
-        """Atualizar vereador exibido"""
+        """Atualizar vereador exibido (sem efeito se nada mudou desde o último desenho)"""
         self.current_vereador = vereador
         
         # Se o timer container NÃO estiver visível, estamos em MODO SESSÃO
@@ -220,31 +268,22 @@ class TelaPlenario(QMainWindow):
         if hasattr(self, 'timer_container') and not self.timer_container.isVisible():
              return
 
+        # Chamado a cada tick pelo painel: só redesenha quando o orador muda
+        fingerprint = self._render_fingerprint(vereador)
+        if fingerprint == self.rendered_fingerprint:
+            return
+        self.rendered_fingerprint = fingerprint
+
         if vereador:
             self.nome_label.setText(vereador['nome'])
             self.partido_label.setText(vereador['partido'])
             
             # Carregar foto
             if vereador.get('foto'):
-                foto_rel = vereador['foto']
-                # Tentar primeiro em AppData, depois no Bundle
-                foto_path = self.session_config.get_data_path(foto_rel)
-                if not os.path.exists(foto_path):
-                    foto_path = self.session_config.get_bundle_path(foto_rel)
-                
-                if os.path.exists(foto_path):
-                    pixmap = QPixmap(foto_path)
-                    # Escalar para o tamanho do widget (320x320)
-                    self.foto_label.setPixmap(
-                        pixmap.scaled(280, 280, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                    )
-                    self.foto_label.setStyleSheet("""
-                        QLabel {
-                            border: 4px solid rgba(255, 255, 255, 0.3);
-                            border-radius: 20px;
-                        }
-                    """)
-                else:
+                # Miniatura de 280px decodificada em background (placeholder até lá)
+                foto = vereador['foto']
+                if not self.photo_cache.request_pixmap(foto, 'plenario',
+                                                       lambda pixmap: self.set_vereador_photo(foto, pixmap)):
                     self.set_placeholder_photo()
             else:
                 self.set_placeholder_photo()
@@ -253,6 +292,23 @@ class TelaPlenario(QMainWindow):
             self.partido_label.setText("")
             self.set_placeholder_photo()
     
+    def set_vereador_photo(self, foto, pixmap):
+        """Aplicar foto carregada (ignora se o orador já mudou)"""
+        if not self.current_vereador or self.current_vereador.get('foto') != foto:
+            return
+        if not self.timer_container.isVisible():
+            return  # Modo sessão: foto_label mostra a logo
+        if pixmap is None:
+            self.set_placeholder_photo()
+            return
+        self.foto_label.setPixmap(pixmap)
+        self.foto_label.setStyleSheet("""
+            QLabel {
+                border: 4px solid rgba(255, 255, 255, 0.3);
+                border-radius: 20px;
+            }
+        """)
+
     def __init__(self):
         super().__init__()
         
@@ -260,15 +316,19 @@ class TelaPlenario(QMainWindow):
         self.remaining_seconds = 0
         self.is_running = False
         self.timer_started = False
+        self.rendered_fingerprint = None  # Último orador desenhado (ver update_vereador)
+        self.foto_stamp = None  # ((id, foto), mtime, verificado em) do orador atual
+        self.countdown = None  # CountdownTimer do painel (fonte da barra de progresso)
         
-        # Blink state
-        self.blink_timer = QTimer(self)
-        self.blink_timer.timeout.connect(self.blink_update)
-        self.blink_state = True # Visible
+        # Fundo pré-escalado (chave: largura, altura, devicePixelRatio)
+        self.background_source = None
+        self.background_pixmap = None
+        self.background_key = None
         
         # Carregar configuração da sessão
         from session_config import SessionConfig
         self.session_config = SessionConfig()
+        self.photo_cache = get_photo_cache(self.session_config)
         
         self.init_ui()
         self.move_to_second_monitor()
@@ -278,6 +338,11 @@ class TelaPlenario(QMainWindow):
 
     # ... (init_ui and others remain same, skipping to update_timer)
 
+    def set_countdown(self, countdown):
+        """Usar o prazo monotônico do painel para animar a barra entre os ticks"""
+        self.countdown = countdown
+        self.progress_bar.set_source(countdown.remaining if countdown else None)
+
     @Slot(int, int, bool)
     def update_timer(self, seconds, total_seconds=0, is_aparte=False):
         """Atualizar cronômetro e barra de progresso"""
@@ -298,49 +363,29 @@ class TelaPlenario(QMainWindow):
         
         # Atualizar Barra de Progresso
         if hasattr(self, 'progress_bar'):
+            self.progress_bar.set_total(total_seconds)
+            if self.countdown is None:
+                self.progress_bar.set_fraction(seconds / total_seconds if total_seconds > 0 else 0)
+            # Entre os ticks a barra se move sozinha enquanto o cronômetro corre
+            self.progress_bar.set_running(self.countdown is not None and self.countdown.is_running)
+            
             if total_seconds > 0:
-                progress = int((seconds / total_seconds) * 100)
-                self.progress_bar.setValue(progress)
-                
                 # Mudar cor da barra baseada no tempo
                 if is_aparte:
-                    chunk_color = "#f8b500" # Amarelo
+                    band = 'aparte'  # Amarelo
                 elif seconds <= 10:
-                    chunk_color = "#e74c3c" # Vermelho
+                    band = 'perigo'  # Vermelho
                 elif seconds <= 30:
-                    chunk_color = "#f39c12" # Laranja
+                    band = 'alerta'  # Laranja
                 else:
-                    chunk_color = "#00f2fe" # Azul
-                    
-                self.progress_bar.setStyleSheet(f"""
-                    QProgressBar {{
-                        border: none;
-                        border-radius: 4px;
-                        background-color: rgba(0, 0, 0, 0.3);
-                    }}
-                    QProgressBar::chunk {{
-                        background-color: {chunk_color};
-                        border-radius: 4px;
-                    }}
-                """)
-            else:
-                self.progress_bar.setValue(0)
+                    band = 'normal'  # Azul
+                self.progress_bar.set_band(band)
 
         # Modo Aparte
         if is_aparte:
-             self.blink_timer.stop()
+             self.blink.stop()
              self.timer_label.setVisible(True)
-             
-             self.timer_label.setStyleSheet("""
-                QLabel {
-                    font-size: 210px;
-                    font-weight: bold;
-                    color: #fceabb;
-                    background: transparent;
-                    border: none;
-                    text-shadow: 2px 2px 4px rgba(0,0,0,0.5);
-                }
-            """)
+             self.timer_label.setColor(self.COLOR_APARTE)
              return
 
         # Modo Normal - Verificar Tempo (Piscar)
@@ -352,39 +397,13 @@ class TelaPlenario(QMainWindow):
             else:
                 interval = 1000
                 
-            if not self.blink_timer.isActive() or self.blink_timer.interval() != interval:
-                self.blink_timer.start(interval)
-            
-            # Estilos apenas mudam cor do texto
-            self.style_blink_on = "font-size: 210px; font-weight: bold; background: transparent; border: none; color: #ff0000;"
-            self.style_blink_off = "font-size: 210px; font-weight: bold; background: transparent; border: none; color: rgba(255, 0, 0, 0.1);"
-            
-            if self.blink_state:
-                 self.timer_label.setStyleSheet(self.style_blink_on)
+            self.blink.start(interval)  # Sem efeito se já pisca nesse ritmo
+            self.timer_label.setColor(self.COLOR_ALERTA)
             
         else:
-            self.blink_timer.stop()
+            self.blink.stop()
             self.timer_label.setVisible(True)
-            self.blink_state = True
-            
-            self.timer_label.setStyleSheet("""
-                QLabel {
-                    font-size: 210px;
-                    font-weight: bold;
-                    color: #ffffff;
-                    background: transparent;
-                    border: none;
-                }
-            """)
-
-    def blink_update(self):
-        """Atualizar animação de piscar"""
-        self.blink_state = not self.blink_state
-        
-        if self.blink_state:
-             self.timer_label.setStyleSheet(self.style_blink_on)
-        else:
-             self.timer_label.setStyleSheet(self.style_blink_off)
+            self.timer_label.setColor(self.COLOR_NORMAL)
     
     @Slot(bool)
     def update_status(self, is_running):
@@ -420,6 +439,8 @@ class TelaPlenario(QMainWindow):
     
     def show_session_info(self):
         """Mostrar logo e número da sessão (Tela de Espera Limpa)"""
+        self.rendered_fingerprint = None  # foto_label/nome passam a mostrar a sessão
+        
         # Esconder Painel do Timer
         if hasattr(self, 'timer_container'):
              self.timer_container.setVisible(False)
@@ -0,0 +1,262 @@
+"""
+Tema da Interface (QSS)
+Folhas de estilo compiladas uma vez a partir de SessionConfig.colors; mudanças
+de estado (cronômetro, status, aparte) trocam propriedades dinâmicas e apenas
+re-polem o widget, sem reinterpretar QSS a cada tick
+"""
+
+from string import Template
+
+DEFAULT_COLORS = {
+    'primary': '#10a37f',
+    'secondary': '#1e4586',
+    'text_primary': '#ffffff',
+    'text_secondary': '#ffffff',
+    'background': '#1a1a2e',
+}
+
+
+def set_state(widget, name, value):
+    """Alterar propriedade dinâmica usada nos seletores do QSS
+
+    Só re-pole quando o valor muda, então pode ser chamado a cada tick.
+    Retorna True se houve mudança.
+    """
+    if widget.property(name) == value:
+        return False
+    widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+    widget.update()
+    return True
+
+
+# Painel do Presidente (janela principal)
+# timerDisplay[state]: normal | aparte | alerta | perigo | esgotado
+# statusLabel[state]: executando | pausado | aguardando | aparte
+# btnAparte[state]: encerrar | cancelar | conceder | bloqueado
+# connStatus[connected]: true | false
+_PANEL_QSS = Template("""
+    QMainWindow {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 #0f0f23, stop:1 $background);
+    }
+    QGroupBox {
+        font-size: 16px;
+        font-weight: bold;
+        color: #ffffff;
+        border: 2px solid rgba(102, 126, 234, 0.3);
+        border-radius: 10px;
+        margin-top: 10px;
+        padding-top: 10px;
+        background: rgba(255, 255, 255, 0.05);
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+    }
+    QPushButton {
+        background: rgba(255, 255, 255, 0.1);
+        color: white;
+        border: 1px solid rgba(255, 255, 255, 0.2);
+        border-radius: 8px;
+        padding: 8px;
+        font-size: 14px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background: rgba(102, 126, 234, 0.3);
+        border-color: #667eea;
+    }
+    QPushButton:pressed {
+        background: rgba(102, 126, 234, 0.5);
+    }
+    QPushButton:disabled {
+        background: rgba(255, 255, 255, 0.05);
+        color: #666;
+    }
+    QLineEdit, QSpinBox {
+        background: rgba(255, 255, 255, 0.1);
+        color: white;
+        border: 1px solid rgba(255, 255, 255, 0.2);
+        border-radius: 6px;
+        padding: 8px;
+        font-size: 14px;
+    }
+    QLineEdit:focus, QSpinBox:focus {
+        border-color: #667eea;
+    }
+    QListWidget {
+        background: rgba(255, 255, 255, 0.05);
+        color: white;
+        border: 1px solid rgba(255, 255, 255, 0.2);
+        border-radius: 8px;
+        padding: 0px;
+    }
+    QListWidget::item {
+        padding: 10px;
+        border-radius: 6px;
+        margin: 2px;
+    }
+    QListWidget::item:hover {
+        background: rgba(102, 126, 234, 0.2);
+    }
+    QListWidget::item:selected {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #667eea, stop:1 #764ba2);
+        color: white;
+    }
+
+    /* Display do cronômetro */
+    QLabel#timerDisplay {
+        font-size: 60px;
+        font-weight: bold;
+        color: #4facfe;
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 rgba(102, 126, 234, 0.1),
+            stop:1 rgba(118, 75, 162, 0.1));
+        border-radius: 15px;
+        padding: 10px;
+    }
+    QLabel#timerDisplay[state="normal"] {
+        margin: 10px;
+    }
+    QLabel#timerDisplay[state="aparte"] {
+        color: #fceabb;
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 rgba(248, 181, 0, 0.2),
+            stop:1 rgba(252, 234, 187, 0.2));
+        border: 2px solid #f8b500;
+        margin: 10px;
+    }
+    QLabel#timerDisplay[state="alerta"] {
+        color: #f39c12;
+        background: rgba(243, 156, 18, 0.1);
+        border: 2px solid #f39c12;
+        margin: 10px;
+    }
+    QLabel#timerDisplay[state="perigo"] {
+        color: #e74c3c;
+        background: rgba(231, 76, 60, 0.1);
+        border: 2px solid #e74c3c;
+        margin: 10px;
+    }
+    QLabel#timerDisplay[state="esgotado"] {
+        color: #ff4d4d;
+        background: rgba(255, 0, 0, 0.15);
+        border: 2px solid #ff4d4d;
+        margin: 10px;
+    }
+
+    /* Status do cronômetro */
+    QLabel#statusLabel {
+        font-size: 24px;
+        font-weight: bold;
+        color: #ffffff;
+        background: rgba(255, 255, 255, 0.1);
+        border-radius: 10px;
+        padding: 10px;
+    }
+    QLabel#statusLabel[state="executando"],
+    QLabel#statusLabel[state="pausado"],
+    QLabel#statusLabel[state="aguardando"],
+    QLabel#statusLabel[state="aparte"] {
+        font-size: 16px;
+        border-radius: 20px;
+        padding: 10px 20px;
+        margin: 5px;
+    }
+    QLabel#statusLabel[state="executando"] {
+        color: #00f2fe;
+        background: rgba(0, 242, 254, 0.2);
+    }
+    QLabel#statusLabel[state="pausado"] {
+        color: #fee140;
+        background: rgba(254, 225, 64, 0.2);
+    }
+    QLabel#statusLabel[state="aparte"] {
+        color: white;
+        background: #f39c12;
+    }
+
+    /* Botão de aparte */
+    QPushButton#btnAparte {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #e67e22, stop:1 #f39c12);
+        color: white;
+        font-weight: bold;
+        font-size: 24px;
+        border-radius: 8px;
+        margin-top: 5px;
+        min-height: 80px;
+    }
+    QPushButton#btnAparte:hover {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #d35400, stop:1 #e67e22);
+    }
+    QPushButton#btnAparte:pressed {
+        background: #c0392b;
+    }
+    QPushButton#btnAparte:disabled {
+        background: rgba(255, 255, 255, 0.05);
+        color: #666;
+    }
+    QPushButton#btnAparte[state="encerrar"] {
+        background: #c0392b;
+        color: white;
+    }
+    QPushButton#btnAparte[state="cancelar"] {
+        background: #34495e;
+        color: white;
+    }
+    QPushButton#btnAparte[state="conceder"] {
+        background: #f39c12;
+        color: white;
+    }
+    QPushButton#btnAparte[state="bloqueado"] {
+        background: #3e3e3e;
+        color: #888;
+    }
+
+    /* Indicadores de conexão (Arduino/Servidor) */
+    QLabel[connStatus="true"] {
+        font-size: 14px;
+        font-weight: bold;
+        color: #ffffff;
+        background-color: rgba(250, 112, 154, 0.4);
+        border: 1px solid #fa709a;
+        border-radius: 8px;
+        padding: 8px;
+    }
+    QLabel[connStatus="true"][connected="true"] {
+        background-color: rgba(0, 242, 254, 0.4);
+        border: 1px solid #00f2fe;
+    }
+""")
+
+
+_compiled = {}
+
+
+def _compile(name, template, values):
+    """Substituir valores no template uma única vez por combinação"""
+    key = (name, tuple(sorted(values.items())))
+    qss = _compiled.get(key)
+    if qss is None:
+        qss = template.substitute(values)
+        _compiled[key] = qss
+    return qss
+
+
+def _colors(colors):
+    merged = dict(DEFAULT_COLORS)
+    merged.update({k: v for k, v in (colors or {}).items() if k in DEFAULT_COLORS and v})
+    return merged
+
+
+def panel_stylesheet(colors=None):
+    """QSS completo do Painel do Presidente para as cores da sessão"""
+    return _compile('panel', _PANEL_QSS, _colors(colors))
+
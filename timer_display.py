@@ -0,0 +1,257 @@
+"""
+Display do Cronômetro (Tela do Plenário)
+Dígitos MM:SS desenhados a partir de glifos pré-renderizados (a cada tick só
+as posições que mudaram são repintadas) e barra de progresso contínua
+interpolada a partir do prazo monotônico do cronômetro
+"""
+
+from PySide6.QtWidgets import QWidget, QSizePolicy
+from PySide6.QtCore import Qt, QRect, QRectF, QSize, QTimer, Property
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QPainter, QPainterPath, QPixmap
+
+GLYPH_CACHE_MAX = 256
+
+# (caractere, cor ARGB, tamanho px, célula w/h, devicePixelRatio) -> QPixmap
+_glyph_cache = {}
+
+
+def glyph_pixmap(char, font, color, cell_size, dpr):
+    """Glifo pré-renderizado (transparente) centralizado numa célula fixa"""
+    key = (char, color.rgba(), font.pixelSize(), cell_size.width(), cell_size.height(), dpr)
+    pixmap = _glyph_cache.get(key)
+    if pixmap is not None:
+        return pixmap
+
+    pixmap = QPixmap(round(cell_size.width() * dpr), round(cell_size.height() * dpr))
+    pixmap.setDevicePixelRatio(dpr)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+    painter.setFont(font)
+    painter.setPen(color)
+    painter.drawText(QRect(0, 0, cell_size.width(), cell_size.height()), Qt.AlignmentFlag.AlignCenter, char)
+    painter.end()
+
+    if len(_glyph_cache) >= GLYPH_CACHE_MAX:
+        _glyph_cache.clear()  # Só acontece se cores/tamanhos variarem muito
+    _glyph_cache[key] = pixmap
+    return pixmap
+
+
+class BigTimerDisplay(QWidget):
+    """Cronômetro grande pintado com glifos em cache
+
+    Substitui um QLabel de 210px: cor e opacidade (piscar) são parâmetros de
+    pintura, não QSS, e setText repinta apenas os dígitos alterados.
+    """
+
+    def __init__(self, text='00:00', pixel_size=210, parent=None):
+        super().__init__(parent)
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        self.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
+        self._text = text
+        self._color = QColor('#ffffff')
+        self._opacity = 1.0
+
+        self.digit_font = QFont('Segoe UI')
+        self.digit_font.setBold(True)
+        self.digit_font.setPixelSize(pixel_size)
+        self._update_metrics()
+
+    def _update_metrics(self):
+        fm = QFontMetrics(self.digit_font)
+        # Células de largura fixa: o texto não "dança" quando os dígitos mudam
+        self.digit_size = QSize(max(fm.horizontalAdvance(d) for d in '0123456789'), fm.height())
+        self.colon_size = QSize(fm.horizontalAdvance(':'), fm.height())
+        self.updateGeometry()
+        self.update()
+
+    def cell_size(self, char):
+        return self.colon_size if char == ':' else self.digit_size
+
+    def sizeHint(self):
+        width = sum(self.cell_size(c).width() for c in self._text)
+        return QSize(width, self.digit_size.height())
+
+    def minimumSizeHint(self):
+        return self.sizeHint()
+
+    def cell_rects(self, text=None):
+        """Retângulos de cada caractere, centralizados no widget"""
+        text = self._text if text is None else text
+        total = sum(self.cell_size(c).width() for c in text)
+        x = (self.width() - total) // 2
+        y = (self.height() - self.digit_size.height()) // 2
+        rects = []
+        for char in text:
+            size = self.cell_size(char)
+            rects.append(QRect(x, y, size.width(), size.height()))
+            x += size.width()
+        return rects
+
+    # --- Parâmetros de exibição ---
+
+    def text(self):
+        return self._text
+
+    def setText(self, text):
+        if text == self._text:
+            return
+        old = self._text
+        self._text = text
+        if len(old) != len(text):
+            self.updateGeometry()
+            self.update()
+            return
+        # Repintar apenas as células cujo caractere mudou
+        for rect, a, b in zip(self.cell_rects(), old, text):
+            if a != b:
+                self.update(rect)
+
+    def color(self):
+        return QColor(self._color)
+
+    def setColor(self, color):
+        color = QColor(color)
+        if color == self._color:
+            return
+        self._color = color
+        self.update()
+
+    def getOpacity(self):
+        return self._opacity
+
+    def setOpacity(self, opacity):
+        opacity = max(0.0, min(1.0, float(opacity)))
+        if opacity == self._opacity:
+            return
+        self._opacity = opacity
+        self.update()
+
+    # Propriedade Qt para permitir animação (QPropertyAnimation)
+    opacity = Property(float, getOpacity, setOpacity)
+
+    def setPixelSize(self, pixel_size):
+        if pixel_size == self.digit_font.pixelSize():
+            return
+        self.digit_font.setPixelSize(pixel_size)
+        self._update_metrics()
+
+    # --- Pintura ---
+
+    def paintEvent(self, event):
+        if self._opacity <= 0.0:
+            return
+        painter = QPainter(self)
+        painter.setOpacity(self._opacity)
+        dpr = self.devicePixelRatioF()
+        dirty = event.rect()
+        for rect, char in zip(self.cell_rects(), self._text):
+            if not rect.intersects(dirty):
+                continue
+            painter.drawPixmap(rect.topLeft(), glyph_pixmap(char, self.digit_font, self._color, rect.size(), dpr))
+        painter.end()
+
+
+# Faixas de cor da barra (pré-calculadas)
+PROGRESS_BANDS = {
+    'normal': QColor('#00f2fe'),  # Azul
+    'aparte': QColor('#f8b500'),  # Amarelo
+    'alerta': QColor('#f39c12'),  # Laranja
+    'perigo': QColor('#e74c3c'),  # Vermelho
+}
+PROGRESS_TRACK = QColor(0, 0, 0, 77)  # rgba(0, 0, 0, 0.3)
+
+
+class SmoothProgressBar(QWidget):
+    """Barra de progresso pintada, animada a partir do cronômetro
+
+    Com uma fonte de tempo (set_source: função que retorna os segundos
+    restantes exatos, ex: CountdownTimer.remaining) a barra anda suavemente
+    enquanto o cronômetro corre, limitada a `fps` quadros por segundo e só
+    repintando quando a largura em pixels muda. Parada, não há timer ativo.
+    """
+
+    def __init__(self, fps=30, parent=None):
+        super().__init__(parent)
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        self.source = None
+        self.total_seconds = 0
+        self.fraction = 0.0
+        self.band_color = PROGRESS_BANDS['normal']
+        self.painted_width = -1  # Largura (px físicos) do último quadro pedido
+
+        self.frame_timer = QTimer(self)
+        self.frame_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.frame_timer.timeout.connect(self._on_frame)
+        self.set_fps(fps)
+
+    def set_fps(self, fps):
+        """Limite de quadros por segundo da animação"""
+        self.frame_timer.setInterval(max(1, round(1000 / max(1, fps))))
+
+    def set_source(self, remaining_fn):
+        """Função que retorna os segundos restantes exatos (None = só valores fixos)"""
+        self.source = remaining_fn
+        self._on_frame()
+
+    def set_total(self, total_seconds):
+        self.total_seconds = max(0, total_seconds)
+
+    def set_band(self, band):
+        color = PROGRESS_BANDS.get(band, PROGRESS_BANDS['normal'])
+        if color != self.band_color:
+            self.band_color = color
+            self.update()
+
+    def set_running(self, running):
+        """Ligar/desligar a animação (parada, um último quadro com o valor exato)"""
+        if running and self.source is not None:
+            if not self.frame_timer.isActive():
+                self.frame_timer.start()
+        else:
+            self.frame_timer.stop()
+        self._on_frame()
+
+    def set_fraction(self, fraction):
+        """Definir progresso fixo (0..1) quando não há fonte de tempo"""
+        self.fraction = max(0.0, min(1.0, fraction))
+        self._request_paint()
+
+    def _on_frame(self):
+        if self.source is None:
+            return
+        if self.total_seconds <= 0:
+            self.set_fraction(0.0)
+            return
+        self.set_fraction(self.source() / self.total_seconds)
+
+    def _chunk_width(self):
+        return round(self.width() * self.devicePixelRatioF() * self.fraction)
+
+    def _request_paint(self):
+        width = self._chunk_width()
+        if width != self.painted_width:
+            self.painted_width = width
+            self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        rect = QRectF(self.rect())
+        radius = rect.height() / 2
+
+        painter.setBrush(PROGRESS_TRACK)
+        painter.drawRoundedRect(rect, radius, radius)
+
+        chunk_w = self._chunk_width() / self.devicePixelRatioF()
+        if chunk_w > 0:
+            # Recorte pelo trilho: a ponta esquerda fica sempre arredondada
+            track = QPainterPath()
+            track.addRoundedRect(rect, radius, radius)
+            painter.setClipPath(track)
+            chunk = QRectF(rect.x(), rect.y(), max(chunk_w, rect.height()), rect.height())
+            painter.setBrush(self.band_color)
+            painter.drawRoundedRect(chunk.intersected(rect), radius, radius)
+        painter.end()
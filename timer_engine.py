@@ -0,0 +1,86 @@
+"""
+Motor de Contagem Regressiva
+Cronômetro baseado em relógio monotônico (time.monotonic)
+"""
+
+import math
+import time
+
+
+class CountdownTimer:
+    """Contagem regressiva derivada de um prazo (deadline) monotônico
+
+    O tempo restante nunca é decrementado por ticks: enquanto roda, ele é
+    calculado a partir do instante de término, então travamentos do loop de
+    eventos ou atrasos de rede não fazem o cronômetro perder tempo.
+    """
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.total_seconds = 0
+        self.is_paused = False
+        self._remaining = 0.0   # Tempo restante congelado (parado/pausado)
+        self._deadline = None   # Instante de término (rodando)
+
+    @property
+    def is_running(self):
+        return self._deadline is not None
+
+    def remaining(self):
+        """Tempo restante exato em segundos (float, nunca negativo)"""
+        deadline = self._deadline  # Lido uma vez: outra thread pode pausar no meio
+        if deadline is None:
+            return self._remaining
+        return max(0.0, deadline - self.clock())
+
+    def remaining_seconds(self):
+        """Tempo restante em segundos inteiros, arredondado para cima (como no display)"""
+        return int(math.ceil(self.remaining() - 1e-6))
+
+    def set_remaining(self, seconds):
+        """Redefinir o tempo restante mantendo o estado (rodando ou parado)"""
+        seconds = max(0.0, float(seconds or 0))
+        if self._deadline is None:
+            self._remaining = seconds
+        else:
+            self._deadline = self.clock() + seconds
+
+    def add(self, seconds):
+        """Somar (ou subtrair, se negativo) tempo ao restante"""
+        self.set_remaining(self.remaining() + seconds)
+
+    def start(self, remaining=None, total=None):
+        """Iniciar/retomar a contagem"""
+        if total is not None:
+            self.total_seconds = total
+        if remaining is None:
+            remaining = self.remaining()
+        self.is_paused = False
+        self._deadline = self.clock() + max(0.0, float(remaining))
+
+    def pause(self, remaining=None):
+        """Pausar congelando o tempo restante"""
+        if remaining is None:
+            remaining = self.remaining()
+        self._deadline = None
+        self._remaining = max(0.0, float(remaining))
+        self.is_paused = True
+
+    def stop(self, total=None):
+        """Parar e voltar ao tempo total"""
+        if total is not None:
+            self.total_seconds = total
+        self._deadline = None
+        self._remaining = float(self.total_seconds or 0)
+        self.is_paused = False
+
+    def snapshot(self):
+        """Estado serializável (campo 'timer' do estado do servidor)"""
+        remaining = self.remaining()
+        return {
+            'total_seconds': self.total_seconds,
+            'remaining_seconds': int(math.ceil(remaining - 1e-6)),
+            'remaining_exact': round(remaining, 3),
+            'is_running': self.is_running,
+            'is_paused': self.is_paused
+        }
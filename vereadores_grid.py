@@ -0,0 +1,342 @@
+"""
+Grid de Vereadores do Painel do Presidente
+Model/View: QAbstractListModel + delegate que pinta foto, nome, partido e seleção
+"""
+
+from collections import OrderedDict
+
+from PySide6.QtWidgets import QListView, QStyledItemDelegate, QStyle, QAbstractItemView
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex, QRect, QRectF, QSize, QTimer, Signal
+from PySide6.QtGui import QColor, QFont, QLinearGradient, QPainter, QPainterPath, QPen
+
+COLS = 5        # Colunas fixas
+ROWS = 4        # Linhas visíveis sem rolagem
+SPACING = 12    # Espaço entre cards
+MARGIN = 8      # Margem interna do card
+TEXT_AREA = 55  # Altura reservada para nome/partido
+
+RESIZE_COALESCE_MS = 16   # Junta rajadas de resize em um relayout por frame
+RESIZE_SETTLE_MS = 200    # Sem resize por esse tempo = redimensionamento terminou
+CROP_CACHE_ITEMS = 400    # Recortes guardados (cards x tamanhos recentes)
+
+VereadorRole = Qt.ItemDataRole.UserRole + 1
+PartidoRole = Qt.ItemDataRole.UserRole + 2
+PhotoRole = Qt.ItemDataRole.UserRole + 3
+SelectedRole = Qt.ItemDataRole.UserRole + 4
+
+
+def vereador_key(vereador):
+    """Chave estável do vereador (id; nome se a lista antiga não tiver id)"""
+    vid = vereador.get('id')
+    return ('id', vid) if vid is not None else ('nome', vereador['nome'])
+
+
+class VereadoresModel(QAbstractListModel):
+    """Lista de vereadores do grid
+
+    set_vereadores() aplica só a diferença (inserir, remover, mover ou
+    atualizar linhas), mantendo as linhas e fotos já carregadas por id.
+    """
+
+    def __init__(self, photo_cache, parent=None):
+        super().__init__(parent)
+        self.photo_cache = photo_cache
+        self.keys = []
+        self.items = {}     # key -> vereador
+        self.pixmaps = {}   # key -> QPixmap (variante 'card') já carregado
+        self.fotos = {}     # key -> foto pedida (descarta resultados antigos)
+        self.selected_key = None
+
+    # --- QAbstractListModel ---
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.keys)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self.keys):
+            return None
+        key = self.keys[index.row()]
+        vereador = self.items[key]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return vereador['nome']
+        if role == PartidoRole:
+            return vereador.get('partido', '')
+        if role == VereadorRole:
+            return vereador
+        if role == PhotoRole:
+            return self.pixmaps.get(key)
+        if role == SelectedRole:
+            return key == self.selected_key
+        return None
+
+    # --- Atualização incremental ---
+
+    def set_vereadores(self, vereadores):
+        """Aplicar nova lista (já filtrada) preservando linhas existentes"""
+        novos = []
+        vistos = set()
+        for vereador in vereadores:
+            key = vereador_key(vereador)
+            if key in vistos:
+                continue  # id duplicado na lista: manter o primeiro
+            vistos.add(key)
+            novos.append((key, vereador))
+
+        # 1. Remover linhas que saíram
+        for row in range(len(self.keys) - 1, -1, -1):
+            key = self.keys[row]
+            if key not in vistos:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self.keys[row]
+                self.items.pop(key, None)
+                self.pixmaps.pop(key, None)
+                self.fotos.pop(key, None)
+                self.endRemoveRows()
+
+        # 2. Inserir, mover ou atualizar na ordem nova
+        for row, (key, vereador) in enumerate(novos):
+            if row < len(self.keys) and self.keys[row] == key:
+                self._update_row(row, key, vereador)
+            elif key in self.items:
+                origem = self.keys.index(key)
+                self.beginMoveRows(QModelIndex(), origem, origem, QModelIndex(), row)
+                self.keys.insert(row, self.keys.pop(origem))
+                self.endMoveRows()
+                self._update_row(row, key, vereador)
+            else:
+                self.beginInsertRows(QModelIndex(), row, row)
+                self.keys.insert(row, key)
+                self.items[key] = vereador
+                self.endInsertRows()
+                self._request_photo(key, vereador.get('foto'))
+
+    def _update_row(self, row, key, vereador):
+        antigo = self.items[key]
+        self.items[key] = vereador
+        if vereador.get('foto') != self.fotos.get(key):
+            self.pixmaps.pop(key, None)
+            self._request_photo(key, vereador.get('foto'))
+        if (vereador['nome'], vereador.get('partido')) != (antigo['nome'], antigo.get('partido')):
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+
+    def _request_photo(self, key, foto):
+        self.fotos[key] = foto
+        if not foto:
+            return
+
+        def on_photo(pixmap):
+            if self.fotos.get(key) != foto:
+                return  # Foto trocada/removida enquanto decodificava
+            if pixmap is None:
+                print(f'[AVISO] Foto nao encontrada ou inválida: {foto}')
+                return
+            self.pixmaps[key] = pixmap
+            self._emit_changed(key)
+        self.photo_cache.request_pixmap(foto, 'card', on_photo)
+
+    def _emit_changed(self, key):
+        if key in self.items:
+            index = self.index(self.keys.index(key))
+            self.dataChanged.emit(index, index)
+
+    def set_selected(self, vereador):
+        """Marcar vereador selecionado (somente as duas linhas afetadas repintam)"""
+        key = vereador_key(vereador) if vereador else None
+        if key == self.selected_key:
+            return
+        anterior, self.selected_key = self.selected_key, key
+        self._emit_changed(anterior)
+        self._emit_changed(key)
+
+
+class VereadorCardDelegate(QStyledItemDelegate):
+    """Pinta o card inteiro (fundo, foto recortada, nome e partido)"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.card_size = QSize(160, 160)
+        self.resizing = False  # Durante resize ao vivo: transformação rápida, sem cache
+        self.crops = OrderedDict()  # (cacheKey da miniatura, w, h) -> QPixmap recortado
+
+        self.nome_font = QFont()
+        self.nome_font.setPixelSize(13)
+        self.nome_font.setBold(True)
+        self.partido_font = QFont()
+        self.partido_font.setPixelSize(12)
+        self.placeholder_font = QFont()
+        self.placeholder_font.setPixelSize(60)
+
+        self.bg_normal = QColor(255, 255, 255, 20)
+        self.border_normal = QColor(255, 255, 255, 31)
+        self.bg_hover = QColor(102, 126, 234, 64)
+        self.border_hover = QColor('#667eea')
+        self.border_selected = QColor('#00f2fe')
+        self.partido_color = QColor(200, 200, 255, 179)
+
+    def sizeHint(self, option, index):
+        return self.card_size
+
+    def photo_rect(self, card_rect):
+        """Área da foto dentro do card (mesma geometria dos antigos QFrames)"""
+        foto_h = max(60, card_rect.height() - TEXT_AREA)
+        return QRect(card_rect.x() + MARGIN, card_rect.y() + MARGIN,
+                     card_rect.width() - 2 * MARGIN, foto_h - MARGIN)
+
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        # Card ocupa a célula do grid menos o espaçamento
+        card = option.rect.adjusted(SPACING // 2, SPACING // 2, -SPACING // 2, -SPACING // 2)
+        card_f = QRectF(card)
+        selected = bool(index.data(SelectedRole))
+        hover = bool(option.state & QStyle.StateFlag.State_MouseOver)
+
+        path = QPainterPath()
+        path.addRoundedRect(card_f.adjusted(0.5, 0.5, -0.5, -0.5), 12, 12)
+        if selected:
+            grad = QLinearGradient(card_f.topLeft(), card_f.bottomRight())
+            grad.setColorAt(0, QColor('#667eea'))
+            grad.setColorAt(1, QColor('#764ba2'))
+            painter.fillPath(path, grad)
+            painter.setPen(QPen(self.border_selected, 2))
+        elif hover:
+            painter.fillPath(path, self.bg_hover)
+            painter.setPen(QPen(self.border_hover, 1))
+        else:
+            painter.fillPath(path, self.bg_normal)
+            painter.setPen(QPen(self.border_normal, 1))
+        painter.drawPath(path)
+
+        # Foto (recorte centralizado preenchendo a área) ou placeholder
+        foto = self.photo_rect(card)
+        pixmap = index.data(PhotoRole)
+        if pixmap is not None and not pixmap.isNull():
+            self.draw_photo(painter, foto, pixmap)
+        else:
+            painter.setFont(self.placeholder_font)
+            painter.setPen(Qt.GlobalColor.white)
+            painter.drawText(foto, Qt.AlignmentFlag.AlignCenter, '👤')
+
+        # Nome e partido
+        text_rect = QRect(card.x() + MARGIN, foto.bottom() + 6,
+                          card.width() - 2 * MARGIN, card.bottom() - foto.bottom() - 6 - MARGIN)
+        painter.setPen(Qt.GlobalColor.white)
+        painter.setFont(self.nome_font)
+        nome_rect = painter.boundingRect(text_rect, Qt.AlignmentFlag.AlignHCenter | Qt.TextFlag.TextWordWrap,
+                                         index.data(Qt.ItemDataRole.DisplayRole))
+        nome_rect.setWidth(text_rect.width())
+        nome_rect.moveLeft(text_rect.x())
+        painter.drawText(nome_rect, Qt.AlignmentFlag.AlignHCenter | Qt.TextFlag.TextWordWrap,
+                         index.data(Qt.ItemDataRole.DisplayRole))
+        painter.setPen(self.partido_color)
+        painter.setFont(self.partido_font)
+        partido_rect = QRect(text_rect.x(), nome_rect.bottom() + 2, text_rect.width(),
+                             max(0, text_rect.bottom() - nome_rect.bottom() - 2))
+        painter.drawText(partido_rect, Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop,
+                         index.data(PartidoRole))
+
+        painter.restore()
+
+    def draw_photo(self, painter, target, pixmap):
+        """Desenhar a miniatura expandida e recortada ao centro de target
+
+        Recortes suaves ficam em cache por tamanho, então repintar (hover,
+        seleção, rolagem) ou voltar a um tamanho já usado não reescala nada.
+        Durante o resize ao vivo desenha com transformação rápida, sem cache.
+        """
+        w, h = target.width(), target.height()
+        if w <= 0 or h <= 0:
+            return
+
+        key = (pixmap.cacheKey(), w, h)
+        cropped = self.crops.get(key)
+        if cropped is not None:
+            self.crops.move_to_end(key)
+            painter.drawPixmap(target.topLeft(), cropped)
+            return
+
+        if self.resizing:
+            scale = max(w / pixmap.width(), h / pixmap.height())
+            src_w, src_h = w / scale, h / scale
+            source = QRectF((pixmap.width() - src_w) / 2, (pixmap.height() - src_h) / 2, src_w, src_h)
+            painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, False)
+            painter.drawPixmap(QRectF(target), pixmap, source)
+            return
+
+        scaled = pixmap.scaled(w, h, Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+                               Qt.TransformationMode.SmoothTransformation)
+        cropped = scaled.copy((scaled.width() - w) // 2, (scaled.height() - h) // 2, w, h)
+        self.crops[key] = cropped
+        while len(self.crops) > CROP_CACHE_ITEMS:
+            self.crops.popitem(last=False)
+        painter.drawPixmap(target.topLeft(), cropped)
+
+
+class VereadoresGridView(QListView):
+    """Grid fixo de 5 colunas x 4 linhas visíveis (cards redimensionam com a janela)"""
+
+    vereador_clicked = Signal(dict)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setViewMode(QListView.ViewMode.ListMode)
+        self.setFlow(QListView.Flow.LeftToRight)
+        self.setWrapping(True)
+        self.setResizeMode(QListView.ResizeMode.Adjust)
+        self.setMovement(QListView.Movement.Static)
+        self.setUniformItemSizes(True)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setFrameShape(QListView.Shape.NoFrame)
+        self.setMouseTracking(True)
+        self.viewport().setAttribute(Qt.WidgetAttribute.WA_Hover)
+        self.viewport().setCursor(Qt.CursorShape.PointingHandCursor)
+
+        self.card_delegate = VereadorCardDelegate(self)
+        self.setItemDelegate(self.card_delegate)
+        self.clicked.connect(self._on_clicked)
+
+        # Resize: um relayout por frame e passe suave só quando assentar
+        self.layout_timer = QTimer(self)
+        self.layout_timer.setSingleShot(True)
+        self.layout_timer.setInterval(RESIZE_COALESCE_MS)
+        self.layout_timer.timeout.connect(self.update_card_size)
+        self.settle_timer = QTimer(self)
+        self.settle_timer.setSingleShot(True)
+        self.settle_timer.setInterval(RESIZE_SETTLE_MS)
+        self.settle_timer.timeout.connect(self._on_resize_settled)
+
+    def _on_clicked(self, index):
+        vereador = index.data(VereadorRole)
+        if vereador:
+            self.vereador_clicked.emit(vereador)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if not self.gridSize().isValid():
+            self.update_card_size()  # Primeira exibição: sem atraso nem passe rápido
+            return
+        self.card_delegate.resizing = True
+        if not self.layout_timer.isActive():
+            self.layout_timer.start()
+        self.settle_timer.start()  # Reinicia a cada evento
+
+    def _on_resize_settled(self):
+        self.update_card_size()
+        self.card_delegate.resizing = False
+        self.viewport().update()  # Passe suave (e cache) no tamanho final
+
+    def update_card_size(self):
+        """Célula = viewport / 5 colunas x 4 linhas (mínimo 80px de altura do card)"""
+        viewport = self.viewport()
+        cell_w = max(1, viewport.width() // COLS)  # Sempre 5 colunas
+        cell_h = max(80 + SPACING, (viewport.height() + SPACING) // ROWS)
+        cell = QSize(cell_w, cell_h)
+        if cell != self.gridSize():
+            self.card_delegate.card_size = cell
+            self.setGridSize(cell)